@@ -8,10 +8,18 @@ import logging
 import hashlib
 import re
 from abc import ABC, abstractmethod
+from collections import defaultdict
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Pattern
 
+# Optional single-pass multi-keyword scanning for fallback scoring
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 
 class BaseFetcher(ABC):
     """Abstract base class for content fetchers"""
@@ -70,6 +78,9 @@ class BaseFetcher(ABC):
         
         # Compile regex patterns for enterprise performance (10x speedup)
         self._compile_keyword_patterns()
+        
+        # Lowercase keyword lists once for the string-matching fallback
+        self._lower_fallback_keywords()
 
     def _compile_keyword_patterns(self):
         """Compile regex patterns for high-performance keyword matching"""
@@ -121,6 +132,45 @@ class BaseFetcher(ABC):
             self._msp_pattern = None
             self._security_pattern = None
 
+    def _lower_fallback_keywords(self):
+        """Lowercase each keyword category once so fallback scoring skips per-call lower()"""
+        self._fallback_keywords_lower = [
+            [kw.lower() for kw in keywords]
+            for keywords in (
+                self.keywords, self.urgency_keywords, self.price_point_keywords,
+                self.competitive_keywords, self.financial_keywords, self.industry_keywords,
+                self.economic_keywords, self.tech_trend_keywords, self.ma_intelligence_keywords,
+                self.cnapp_keywords, self.cnapp_cloud_security_keywords,
+                self.channel_intelligence_keywords, self.vendors
+            )
+        ]
+        self._fallback_automaton = self._build_fallback_automaton()
+
+    def _build_fallback_automaton(self):
+        """Build an Aho-Corasick automaton over the fallback keywords (None if unavailable)"""
+        if not AHOCORASICK_AVAILABLE:
+            return None
+        
+        # Keyword -> category index per list entry, so duplicates still count twice
+        self._fallback_keyword_categories = defaultdict(list)
+        self._fallback_empty_counts = [0] * len(self._fallback_keywords_lower)
+        for index, keywords in enumerate(self._fallback_keywords_lower):
+            for keyword in keywords:
+                if keyword:
+                    self._fallback_keyword_categories[keyword].append(index)
+                else:
+                    # An empty keyword is a substring of every text
+                    self._fallback_empty_counts[index] += 1
+        
+        if not self._fallback_keyword_categories:
+            return None
+        
+        automaton = ahocorasick.Automaton()
+        for keyword in self._fallback_keyword_categories:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        return automaton
+
     def _compile_pattern_list(self, keywords: List[str]) -> Pattern:
         """Compile a list of keywords into a single optimized regex pattern"""
         if not keywords:
@@ -933,43 +983,48 @@ class BaseFetcher(ABC):
         
         return min(boost_score, 4.0)  # Cap cloud security boost at 4.0 for consistent scoring
 
+    def _count_fallback_matches(self, text_lower: str) -> List[int]:
+        """Count, per fallback category, the keywords that occur in text_lower"""
+        if self._fallback_automaton is None:
+            return [sum(1 for kw in keywords if kw in text_lower)
+                    for keywords in self._fallback_keywords_lower]
+        
+        # One automaton pass finds every keyword; each keyword then counts
+        # once for every category entry that lists it
+        counts = list(self._fallback_empty_counts)
+        keyword_categories = self._fallback_keyword_categories
+        for keyword in {keyword for _, keyword in self._fallback_automaton.iter(text_lower)}:
+            for index in keyword_categories[keyword]:
+                counts[index] += 1
+        return counts
+
     def _calculate_relevance_score_fallback(self, text: str) -> float:
         """Fallback scoring method using string matching"""
         text_lower = text.lower()
         score = 0.0
+        (keyword_count, urgency_count, price_point_count, competitive_count,
+         financial_count, industry_count, economic_count, tech_trend_count,
+         ma_intelligence_count, cnapp_count, cnapp_cloud_count,
+         channel_intelligence_count, vendor_count) = self._count_fallback_matches(text_lower)
 
         # Base pricing keywords (fallback)
-        keyword_matches = [kw for kw in self.keywords if kw.lower() in text_lower]
-        keyword_score = len(keyword_matches) * self.config['scoring']['keyword_weight']
+        keyword_score = keyword_count * self.config['scoring']['keyword_weight']
         score += keyword_score
 
         # Urgency indicators (fallback)
-        urgency_matches = [kw for kw in self.urgency_keywords if kw.lower() in text_lower]
-        urgency_score = len(urgency_matches) * self.config['scoring']['urgency_weight']
+        urgency_score = urgency_count * self.config['scoring']['urgency_weight']
         score += urgency_score
 
         # Enhanced keyword categories (fallback)
-        price_point_matches = [kw for kw in self.price_point_keywords if kw.lower() in text_lower]
-        competitive_matches = [kw for kw in self.competitive_keywords if kw.lower() in text_lower]
-        financial_matches = [kw for kw in self.financial_keywords if kw.lower() in text_lower]
-        industry_matches = [kw for kw in self.industry_keywords if kw.lower() in text_lower]
-        economic_matches = [kw for kw in self.economic_keywords if kw.lower() in text_lower]
-        tech_trend_matches = [kw for kw in self.tech_trend_keywords if kw.lower() in text_lower]
-        ma_intelligence_matches = [kw for kw in self.ma_intelligence_keywords if kw.lower() in text_lower]
-        cnapp_matches = [kw for kw in self.cnapp_keywords if kw.lower() in text_lower]
-        cnapp_cloud_matches = [kw for kw in self.cnapp_cloud_security_keywords if kw.lower() in text_lower]
-        channel_intelligence_matches = [kw for kw in self.channel_intelligence_keywords if kw.lower() in text_lower]
-
-        enhanced_score = (len(price_point_matches) * 1.2 + len(competitive_matches) * 1.5 + 
-                         len(financial_matches) * 1.0 + len(industry_matches) * 0.8 + 
-                         len(economic_matches) * 1.0 + len(tech_trend_matches) * 0.9 +
-                         len(ma_intelligence_matches) * 2.0 + len(cnapp_matches) * 3.0 + 
-                         len(cnapp_cloud_matches) * 2.0 + len(channel_intelligence_matches) * 2.5)
+        enhanced_score = (price_point_count * 1.2 + competitive_count * 1.5 + 
+                         financial_count * 1.0 + industry_count * 0.8 + 
+                         economic_count * 1.0 + tech_trend_count * 0.9 +
+                         ma_intelligence_count * 2.0 + cnapp_count * 3.0 + 
+                         cnapp_cloud_count * 2.0 + channel_intelligence_count * 2.5)
         score += enhanced_score
 
         # Vendor mentions (fallback)
-        vendor_matches = [vendor for vendor in self.vendors if vendor.lower() in text_lower]
-        vendor_score = len(vendor_matches) * self.config['scoring']['vendor_weight']
+        vendor_score = vendor_count * self.config['scoring']['vendor_weight']
         score += vendor_score
 
         return score
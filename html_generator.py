@@ -41,14 +41,19 @@ System: ULTRATHINK-AI-PRO v3.1.0 Hybrid
 """
 
 import os
+import re
 import json
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Iterator, Optional, TextIO
 
 
 class EnhancedHTMLGenerator:
     """Enhanced HTML report generator with accessibility and mobile responsiveness"""
     
+    # Priority keyword tiers, matched against upper-cased insight text
+    ALPHA_PRIORITY_KEYWORDS = ('URGENT', 'CRITICAL', 'EMERGENCY', '🔴')
+    BETA_PRIORITY_KEYWORDS = ('MODERATE', 'NOTABLE', 'IMPORTANT', '🟡')
+    
     def __init__(self, debug: bool = False):
         self.debug = debug
         
@@ -58,12 +63,23 @@ class EnhancedHTMLGenerator:
             'VMware', 'AWS', 'Azure', 'Google Cloud', 'Oracle', 'CrowdStrike',
             'Fortinet', 'Palo Alto Networks', 'Zscaler', 'SentinelOne'
         ]
+        
+        # Single-pass highlighter; longest names first so 'HPE' wins over 'HP'
+        self._vendor_pattern = re.compile(
+            r'\b(?:' + '|'.join(re.escape(v) for v in sorted(self.vendor_keywords, key=len, reverse=True)) + r')\b',
+            re.IGNORECASE
+        )
     
     def generate_html_report(self, insights: List[str], all_content: List[Dict[str, Any]], 
                            vendor_analysis: Dict[str, Any], config: Dict[str, Any],
                            performance_metrics: Optional[Dict[str, Any]] = None,
-                           source_mapping: Optional[Dict[str, Any]] = None) -> str:
-        """Generate complete HTML report matching backup system format exactly"""
+                           source_mapping: Optional[Dict[str, Any]] = None,
+                           out: Optional[TextIO] = None) -> Optional[str]:
+        """Generate complete HTML report matching backup system format exactly
+        
+        When ``out`` is given the report is written to it section by section and
+        None is returned; otherwise the full document is returned as a string.
+        """
         
         # Process data
         content_by_source = self._group_content_by_source(all_content)
@@ -103,19 +119,23 @@ class EnhancedHTMLGenerator:
         # Use actual count from source mapping (items actually processed by GPT)
         gpt_analyzed_count = len(source_mapping) if source_mapping else min(20, reddit_count + google_count)
         
-        # Generate timestamp
-        timestamp = datetime.now()
+        chunks = self._iter_report_chunks(all_content, content_by_source, categorized_insights, vendor_stats,
+                                          gpt_analyzed_count, reddit_count, google_count)
         
-        # Generate HTML sections in backup format
-        executive_summary = self._generate_executive_summary(len(all_content))
-        insights_pagination = self._generate_insights_pagination(categorized_insights)
-        vendor_section = self._generate_vendor_section_backup_format(vendor_stats)
-        sources_section = self._generate_detailed_sources_section(content_by_source, gpt_analyzed_count, reddit_count, google_count)
-        methodology_section = self._generate_methodology_section()
-        javascript_functions = self._generate_javascript_functions()
+        # Stream sections straight to the caller's file handle when one is given
+        if out is not None:
+            for chunk in chunks:
+                out.write(chunk)
+            return None
         
-        # Generate complete HTML in backup format
-        html_content = f"""
+        return ''.join(chunks)
+    
+    def _iter_report_chunks(self, all_content: List[Dict[str, Any]],
+                            content_by_source: Dict[str, List[Dict[str, Any]]],
+                            categorized_insights: Dict[str, List], vendor_stats: Dict[str, Any],
+                            gpt_analyzed_count: int, reddit_count: int, google_count: int) -> Iterator[str]:
+        """Yield the complete HTML report in backup format, one section at a time"""
+        yield """
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -124,8 +144,11 @@ class EnhancedHTMLGenerator:
     <meta name="description" content="ULTRATHINK-AI-PRO Enhanced Pricing Intelligence Report for B2B IT Enterprise">
     <title>ULTRATHINK-AI-PRO Enhanced Analysis Report</title>
     <link rel="stylesheet" href="../static/css/report.css">
-    {self._generate_backup_css_styles()}
-    {javascript_functions}
+    """
+        yield self._generate_backup_css_styles()
+        yield "\n    "
+        yield self._generate_javascript_functions()
+        yield """
 </head>
 <body>
     <main class="email-preview" role="main">
@@ -140,21 +163,27 @@ class EnhancedHTMLGenerator:
         </header>
         
         <div class="email-content" role="document">
-            {executive_summary}
-            {insights_pagination}
-            {vendor_section}
+            """
+        yield self._generate_executive_summary(len(all_content))
+        yield "\n            "
+        yield self._generate_insights_pagination(categorized_insights)
+        yield "\n            "
+        yield self._generate_vendor_section_backup_format(vendor_stats)
+        yield """
         </div>
         
-        {sources_section}
-        {methodology_section}
-        {self._generate_professional_footer_section()}
+        """
+        yield self._generate_detailed_sources_section(content_by_source, gpt_analyzed_count, reddit_count, google_count)
+        yield "\n        "
+        yield self._generate_methodology_section()
+        yield "\n        "
+        yield self._generate_professional_footer_section()
+        yield """
         
     </main>
 </body>
 </html>
         """
-        
-        return html_content
     
     def _create_source_id_mapping(self, all_content: List[Dict[str, Any]]) -> None:
         """Create mapping from SOURCE_IDs to content for footnote generation"""
@@ -179,16 +208,46 @@ class EnhancedHTMLGenerator:
     
     def save_html_report(self, html_content: str, output_dir: str = "output") -> str:
         """Save HTML report to file"""
-        os.makedirs(output_dir, exist_ok=True)
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f"ultrathink_enhanced_{timestamp}.html"
-        filepath = os.path.join(output_dir, filename)
+        filepath = self._report_filepath(output_dir)
         
         with open(filepath, 'w', encoding='utf-8') as f:
             f.write(html_content)
         
         return filepath
     
+    def write_html_report(self, filepath: str, insights: List[str], all_content: List[Dict[str, Any]],
+                          vendor_analysis: Dict[str, Any], config: Dict[str, Any],
+                          performance_metrics: Optional[Dict[str, Any]] = None,
+                          source_mapping: Optional[Dict[str, Any]] = None) -> str:
+        """Stream the HTML report to filepath, replacing it only once rendering succeeds"""
+        tmp_path = f"{filepath}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                self.generate_html_report(
+                    insights=insights,
+                    all_content=all_content,
+                    vendor_analysis=vendor_analysis,
+                    config=config,
+                    performance_metrics=performance_metrics,
+                    source_mapping=source_mapping,
+                    out=f
+                )
+            os.replace(tmp_path, filepath)
+        except Exception:
+            # Never leave a half-rendered report behind
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        
+        return filepath
+    
+    def _report_filepath(self, output_dir: str) -> str:
+        """Create the output directory and return a timestamped report path"""
+        os.makedirs(output_dir, exist_ok=True)
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        filename = f"ultrathink_enhanced_{timestamp}.html"
+        return os.path.join(output_dir, filename)
+    
     def _group_content_by_source(self, all_content: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
         """Group content by source"""
         grouped = {}
@@ -211,14 +270,12 @@ class EnhancedHTMLGenerator:
                 insight_text = str(insight)
                 
             insight_upper = insight_text.upper()
-            if any(word in insight_upper for word in ['URGENT', 'CRITICAL', 'EMERGENCY', '🔴']):
+            if any(word in insight_upper for word in self.ALPHA_PRIORITY_KEYWORDS):
                 categorized['alpha'].append(insight)
-            elif any(word in insight_upper for word in ['MODERATE', 'NOTABLE', 'IMPORTANT', '🟡']):
+            elif any(word in insight_upper for word in self.BETA_PRIORITY_KEYWORDS):
                 categorized['beta'].append(insight)
-            elif any(word in insight_upper for word in ['MONITORING', 'INFO', 'WATCH', 'GENERAL', '🟢']):
-                categorized['gamma'].append(insight)
             else:
-                # Default to gamma for unknown priority
+                # MONITORING/INFO/WATCH/GENERAL/🟢 and unknown priorities all land in gamma
                 categorized['gamma'].append(insight)
         
         return categorized
@@ -577,7 +634,7 @@ class EnhancedHTMLGenerator:
         """Generate sources section matching backup format with collapsible sections"""
         total_items = sum(len(items) for items in content_by_source.values())
         
-        sources_html = f"""
+        sources_html = [f"""
         <div class='analysis-section'>
             <h2>📄 Content Sources Analyzed</h2>
             <p><strong>Total Items Processed by GPT:</strong> {total_items}</p>
@@ -589,7 +646,7 @@ class EnhancedHTMLGenerator:
             </div>
         
         <p style="color: #28a745; font-weight: bold;">✅ Sources that GPT analyzed to generate the insights above:</p>
-        """
+        """]
         
         footnote_index = 1
         
@@ -606,14 +663,14 @@ class EnhancedHTMLGenerator:
                 'twitter': '🐦'
             }.get(source.lower(), '📊')
             
-            sources_html += f"""
+            sources_html.append(f"""
             <div class='provider-section {source_class}'>
                 <div class='provider-header' onclick='toggleProvider("{source.lower()}")'>
                     <span>{source_icon} {source.title()} ({len(items)} items analyzed by GPT)</span>
                     <span class='toggle-icon' id='{source.lower()}-icon'>▶</span>
                 </div>
                 <div class='provider-content' id='{source.lower()}-content'>
-            """
+            """)
             
             # Generate content items with footnote linking
             for item in items:
@@ -638,7 +695,7 @@ class EnhancedHTMLGenerator:
                 # Highlight vendors in content
                 highlighted_content = self._highlight_vendors(content[:500])  # Limit content length
                 
-                sources_html += f"""
+                sources_html.append(f"""
                 <div class='content-item footnote-target' id='footnote-{footnote_index}'>
                     <h4 style='margin: 0 0 10px 0; color: #007bff;'><strong>[{footnote_index}]</strong> {title}</h4>
                     <p><strong>🔗 URL:</strong> <a href='{url}' target='_blank'>{url}</a></p>
@@ -649,17 +706,17 @@ class EnhancedHTMLGenerator:
                         <p style='margin-top: 10px; padding: 10px; background-color: #f8f9fa; border-radius: 4px;'>{highlighted_content}</p>
                     </details>
                 </div>
-                """
+                """)
                 
                 footnote_index += 1
             
-            sources_html += """
+            sources_html.append("""
                 </div>
             </div>
-            """
+            """)
         
-        sources_html += "</div>"
-        return sources_html
+        sources_html.append("</div>")
+        return ''.join(sources_html)
     
     def _generate_javascript_functions(self) -> str:
         """Generate ENHANCED JavaScript functions with professional interactivity"""
@@ -1471,14 +1528,10 @@ class EnhancedHTMLGenerator:
     
     def _highlight_vendors(self, text: str) -> str:
         """Highlight vendor names in text with enhanced styling"""
-        highlighted = text
-        for vendor in self.vendor_keywords:
-            if vendor in highlighted:
-                highlighted = highlighted.replace(
-                    vendor, 
-                    f'<span class="vendor-highlight" style="background: linear-gradient(135deg, #ffeb3b 0%, #ffc107 100%); padding: 2px 6px; border-radius: 4px; font-weight: 600; box-shadow: 0 1px 3px rgba(255,193,7,0.3);">{vendor}</span>'
-                )
-        return highlighted
+        return self._vendor_pattern.sub(
+            lambda m: f'<span class="vendor-highlight" style="background: linear-gradient(135deg, #ffeb3b 0%, #ffc107 100%); padding: 2px 6px; border-radius: 4px; font-weight: 600; box-shadow: 0 1px 3px rgba(255,193,7,0.3);">{m.group(0)}</span>',
+            text
+        )
     
     def _generate_vendor_chart_bars(self, vendors: List[str], mentions: List[int]) -> str:
         """Generate interactive chart bars for vendor analysis"""
@@ -1522,8 +1575,8 @@ class EnhancedHTMLGenerator:
         footnote_accuracy_stats = {'total_mapped': 0, 'successfully_matched': 0, 'fallback_used': 0}
         
         # Generate source items with footnotes synchronized to source_id_mapping
-        reddit_items_html = ""
-        google_items_html = ""
+        reddit_items_html = []
+        google_items_html = []
         
         # ENHANCED: Create comprehensive lookup for SOURCE_ID to footnote number
         source_id_to_footnote = {}
@@ -1639,7 +1692,7 @@ class EnhancedHTMLGenerator:
             footnote_num = mapping_data['footnote_number']
             content_preview = mapping_data.get('content_preview', '')[:150] + "..." if mapping_data.get('content_preview') else ''
             
-            reddit_items_html += f"""
+            reddit_items_html.append(f"""
             <div id="footnote-{footnote_num}" class="footnote-target enhanced-footnote-target" 
                  style="margin: 12px 0; padding: 15px; background: linear-gradient(135deg, #fff5f5 0%, #f8f9fa 100%); 
                         border-left: 4px solid #ff4500; border-radius: 8px; transition: all 0.3s ease;"
@@ -1656,7 +1709,7 @@ class EnhancedHTMLGenerator:
                 </div>
                 {f'<div class="content-preview" style="font-size: 11px; color: #495057; font-style: italic; margin-top: 8px; padding: 8px; background: rgba(255,255,255,0.7); border-radius: 4px;">{content_preview}</div>' if content_preview else ''}
             </div>
-            """
+            """)
             footnotes.append(f'<a href="{url}" target="_blank">[{footnote_num}] {title}</a>')
         
         # ENHANCED: Generate Google items HTML with improved formatting
@@ -1668,7 +1721,7 @@ class EnhancedHTMLGenerator:
             footnote_num = mapping_data['footnote_number']
             content_preview = mapping_data.get('content_preview', '')[:150] + "..." if mapping_data.get('content_preview') else ''
             
-            google_items_html += f"""
+            google_items_html.append(f"""
             <div id="footnote-{footnote_num}" class="footnote-target enhanced-footnote-target" 
                  style="margin: 12px 0; padding: 15px; background: linear-gradient(135deg, #f0f8ff 0%, #f8f9fa 100%); 
                         border-left: 4px solid #4285f4; border-radius: 8px; transition: all 0.3s ease;"
@@ -1685,7 +1738,7 @@ class EnhancedHTMLGenerator:
                 </div>
                 {f'<div class="content-preview" style="font-size: 11px; color: #495057; font-style: italic; margin-top: 8px; padding: 8px; background: rgba(255,255,255,0.7); border-radius: 4px;">{content_preview}</div>' if content_preview else ''}
             </div>
-            """
+            """)
             footnotes.append(f'<a href="{url}" target="_blank">[{footnote_num}] {title}</a>')
         
         # ENHANCED: Generate the complete sources section with accuracy reporting
@@ -1777,7 +1830,7 @@ class EnhancedHTMLGenerator:
                     <span id="reddit-toggle" style="font-size: 18px; transition: transform 0.3s ease;">▶</span>
                 </div>
                 <div id="reddit-provider" class="provider-content enhanced-provider-content" style="display: none; padding: 20px; background: #fff; max-height: 500px; overflow-y: auto;">
-                    {reddit_items_html if reddit_items_html else '<div style="text-align: center; padding: 40px; color: #666; font-style: italic;"><span style="font-size: 48px; margin-bottom: 15px; display: block;">📭</span>No Reddit content analyzed in this run.</div>'}
+                    {''.join(reddit_items_html) if reddit_items_html else '<div style="text-align: center; padding: 40px; color: #666; font-style: italic;"><span style="font-size: 48px; margin-bottom: 15px; display: block;">📭</span>No Reddit content analyzed in this run.</div>'}
                 </div>
             </div>
             
@@ -1790,7 +1843,7 @@ class EnhancedHTMLGenerator:
                     <span id="google-toggle" style="font-size: 18px; transition: transform 0.3s ease;">▶</span>
                 </div>
                 <div id="google-provider" class="provider-content enhanced-provider-content" style="display: none; padding: 20px; background: #fff; max-height: 500px; overflow-y: auto;">
-                    {google_items_html if google_items_html else '<div style="text-align: center; padding: 40px; color: #666; font-style: italic;"><span style="font-size: 48px; margin-bottom: 15px; display: block;">📭</span>No Google content analyzed in this run (quota exceeded).</div>'}
+                    {''.join(google_items_html) if google_items_html else '<div style="text-align: center; padding: 40px; color: #666; font-style: italic;"><span style="font-size: 48px; margin-bottom: 15px; display: block;">📭</span>No Google content analyzed in this run (quota exceeded).</div>'}
                 </div>
             </div>
         </div>
@@ -2071,12 +2124,11 @@ def generate_and_save_report(insights: List[str], all_content: List[Dict[str, An
     """Convenience function to generate and save HTML report"""
     generator = EnhancedHTMLGenerator(debug=False)
     
-    html_content = generator.generate_html_report(
+    return generator.write_html_report(
+        generator._report_filepath(output_dir),
         insights=insights,
         all_content=all_content,
         vendor_analysis=vendor_analysis,
         config=config,
         performance_metrics=performance_metrics
-    )
-    
-    return generator.save_html_report(html_content, output_dir)
\ No newline at end of file
+    )
\ No newline at end of file
@@ -428,7 +428,9 @@ async def generate_report(summary: Dict[str, Any], all_content: Dict[str, Any],
         else:
             logger.info("📋 No summarizer source mapping available, using original content")
         
-        html_content = generator.generate_html_report(
+        # Stream the report to disk; the file only appears once rendering succeeds
+        generator.write_html_report(
+            output_file,
             insights=insights,
             all_content=sum(all_content.values(), []),
             vendor_analysis=vendor_analysis,
@@ -436,10 +438,6 @@ async def generate_report(summary: Dict[str, Any], all_content: Dict[str, Any],
             source_mapping=source_mapping
         )
         
-        # Save report
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-        
         logger.info(f"✅ Enhanced report saved: {output_file}")
         logger.info(f"🎯 Generated report with {len(insights)} insights and {len(vendor_analysis)} vendors")
         
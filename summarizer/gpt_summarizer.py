@@ -11,6 +11,13 @@ from typing import Dict, List, Any, Optional
 from utils.company_alias_matcher import get_company_matcher
 from utils.employee_manager import EmployeeManager, load_employee_manager
 
+# Optional single-pass multi-vendor scanning
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 # Import security components
 try:
     from utils.security_manager import (
@@ -42,6 +49,8 @@ class GPTSummarizer:
         
         # Enhanced keyword system based on company mappings
         self.key_vendors = list(self.company_matcher.company_mappings.keys())
+        self._key_vendors_lower = [(vendor, vendor.lower()) for vendor in self.key_vendors]
+        self._vendor_automaton = self._build_vendor_automaton()
         
         # Enhanced urgency detection with industry-specific terms
         self.urgency_keywords = {
@@ -534,7 +543,7 @@ class GPTSummarizer:
         
         # NEW: Vendor context boost - if 2+ vendors mentioned, likely pricing relevant
         try:
-            vendor_count = len(self.company_matcher.find_companies_in_text(text).matched_companies)
+            vendor_count = len(self.company_matcher.find_companies_fast(text))
             if vendor_count >= 2:
                 return True
         except:
@@ -582,7 +591,14 @@ class GPTSummarizer:
             section_content = []
             # Adaptive processing limits based on content quality and source
             limit = self._calculate_adaptive_processing_limit(source, items)
-            for item in items[:limit]:  # Dynamic limit based on content quality
+            selected_items = items[:limit]  # Dynamic limit based on content quality
+            
+            # Detect companies for the whole section in one alias matcher batch
+            full_texts = [f"{item.get('title', '')} {item.get('content', item.get('text', ''))}"
+                          for item in selected_items]
+            company_results = self.company_matcher.find_companies_in_texts(full_texts)
+            
+            for item, full_text, company_result in zip(selected_items, full_texts, company_results):
                 # Enhanced item processing with company detection
                 title = item.get('title', '')
                 content = item.get('content', item.get('text', ''))
@@ -590,10 +606,6 @@ class GPTSummarizer:
                 score = item.get('relevance_score', 0)
                 created_at = item.get('created_at', '')
                 
-                # Detect companies using alias matcher
-                full_text = f"{title} {content}"
-                company_result = self.company_matcher.find_companies_in_text(full_text)
-                
                 # Calculate enhanced relevance score
                 enhanced_score = self._calculate_enhanced_relevance_score(
                     item, company_result, full_text
@@ -729,7 +741,7 @@ class GPTSummarizer:
             
             # Check vendor richness
             try:
-                vendor_count = len(self.company_matcher.find_companies_in_text(full_text).matched_companies)
+                vendor_count = len(self.company_matcher.find_companies_fast(full_text))
                 if vendor_count >= 2:
                     vendor_rich_items += 1
                 elif vendor_count == 1:
@@ -1969,6 +1981,24 @@ RETURN VALID JSON WITH QUANTIFIED PRICING INTELLIGENCE:"""
             logger.error(f"Validation error: {e}")
             return False
 
+    def _build_vendor_automaton(self):
+        """Build an Aho-Corasick automaton over lowercased vendor names (None if unavailable)"""
+        if not AHOCORASICK_AVAILABLE:
+            return None
+        
+        automaton = ahocorasick.Automaton()
+        for vendor, vendor_lower in self._key_vendors_lower:
+            automaton.add_word(vendor_lower, vendor)
+        automaton.make_automaton()
+        return automaton
+    
+    def _extract_vendors(self, text: str) -> set:
+        """Return the key vendors whose name occurs anywhere in text (case-insensitive substring)"""
+        text_lower = text.lower()
+        if self._vendor_automaton is not None:
+            return {vendor for _, vendor in self._vendor_automaton.iter(text_lower)}
+        return {vendor for vendor, vendor_lower in self._key_vendors_lower if vendor_lower in text_lower}
+    
     def _add_analysis_metadata(self, result: Dict[str, Any], content_by_source: Dict[str, List[Dict]]) -> Dict[str, Any]:
         """Add comprehensive analysis metadata including sources, keywords, and raw content"""
         
@@ -2006,10 +2036,9 @@ RETURN VALID JSON WITH QUANTIFIED PRICING INTELLIGENCE:"""
         # Fix vendor mention counts to be consistent across roles
         actual_vendor_mentions = {}
         for item in analyzed_content:
-            text = f"{item.get('title', '')} {item.get('content_preview', '')}".lower()
-            for vendor in self.key_vendors:
-                if vendor.lower() in text:
-                    actual_vendor_mentions[vendor] = actual_vendor_mentions.get(vendor, 0) + 1
+            text = f"{item.get('title', '')} {item.get('content_preview', '')}"
+            for vendor in self._extract_vendors(text):
+                actual_vendor_mentions[vendor] = actual_vendor_mentions.get(vendor, 0) + 1
         
         # Update vendor counts in each role summary
         for role_key, role_data in result.get('role_summaries', {}).items():
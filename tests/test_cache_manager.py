@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Test suite for Cache Manager
+Validates cache key generation and cache read/write behaviour
+"""
+import unittest
+import sys
+import os
+import tempfile
+import shutil
+import threading
+import time
+import gc
+import weakref
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.cache_manager import CacheManager
+
+
+class TestCacheManager(unittest.TestCase):
+    """Test cases for Cache Manager"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache = CacheManager(cache_dir=self.temp_dir)
+
+    def tearDown(self):
+        """Clean up test fixtures"""
+        self.cache.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_cache_key_is_deterministic(self):
+        """Test that param ordering does not change the cache key"""
+        key_a = self.cache._generate_cache_key('reddit', {'sub': 'sysadmin', 'limit': 50})
+        key_b = self.cache._generate_cache_key('reddit', {'limit': 50, 'sub': 'sysadmin'})
+        self.assertEqual(key_a, key_b)
+
+    def test_cache_key_distinguishes_param_types(self):
+        """Test that scalar params of different types produce different keys"""
+        key_int = self.cache._generate_cache_key('google', {'page': 1})
+        key_str = self.cache._generate_cache_key('google', {'page': '1'})
+        self.assertNotEqual(key_int, key_str)
+
+    def test_cache_key_nested_params(self):
+        """Test that nested params still produce stable keys"""
+        key_a = self.cache._generate_cache_key('google', {'queries': ['a', 'b'], 'opts': {'x': 1}})
+        key_b = self.cache._generate_cache_key('google', {'opts': {'x': 1}, 'queries': ['a', 'b']})
+        self.assertEqual(key_a, key_b)
+        self.assertNotEqual(key_a, self.cache._generate_cache_key('google'))
+
+    def test_set_and_get_roundtrip(self):
+        """Test data written with set() is returned by get()"""
+        payload = {'posts': [{'title': 'Dell price increase'}]}
+        self.cache.set('api', 'reddit', payload, {'limit': 10})
+        self.assertEqual(self.cache.get('api', 'reddit', {'limit': 10}), payload)
+        self.assertIsNone(self.cache.get('api', 'reddit', {'limit': 20}))
+
+    def test_get_served_from_memory(self):
+        """Test repeat reads are served from the memory layer without disk I/O"""
+        self.cache.set('summary', 'weekly', {'insights': 3})
+        self.cache.flush()
+        cache_file = self.cache._get_cache_file('summary', 'weekly')
+        cache_file.unlink()
+        self.assertEqual(self.cache.get('summary', 'weekly'), {'insights': 3})
+
+    def test_memory_hits_return_private_copies(self):
+        """Test mutating set() input or get() results does not alter the cache"""
+        payload = {'posts': [1]}
+        self.cache.set('api', 'reddit', payload)
+        payload['posts'].append(2)
+        first = self.cache.get('api', 'reddit')
+        first['posts'].append(3)
+        self.assertEqual(self.cache.get('api', 'reddit'), {'posts': [1]})
+
+    def test_memory_layer_is_bounded(self):
+        """Test the memory layer evicts least recently used entries"""
+        cache = CacheManager(cache_dir=self.temp_dir, memory_size=2)
+        for name in ('a', 'b', 'c'):
+            cache.set('api', name, name)
+        cache.flush()
+        self.assertEqual(len(cache._mem), 2)
+        self.assertNotIn(cache._get_cache_file('api', 'a'), cache._mem)
+        # Evicted entries are still readable from disk
+        self.assertEqual(cache.get('api', 'a'), 'a')
+        cache.close()
+
+    def test_invalidate_drops_both_layers(self):
+        """Test invalidate() removes memory and disk entries"""
+        self.cache.set('processed', 'vendors', ['dell'])
+        self.cache.invalidate('processed', 'vendors')
+        self.assertFalse(self.cache._get_cache_file('processed', 'vendors').exists())
+        self.assertIsNone(self.cache.get('processed', 'vendors'))
+
+    def test_flush_writes_queued_entries(self):
+        """Test flush() persists queued writes and leaves no temp files"""
+        self.cache.set('api', 'google', {'results': 5})
+        self.cache.flush()
+        cache_file = self.cache._get_cache_file('api', 'google')
+        self.assertTrue(cache_file.exists())
+        self.assertEqual(list(cache_file.parent.glob('*.tmp')), [])
+
+    def test_set_after_close_writes_synchronously(self):
+        """Test set() still persists data once the manager has been closed"""
+        self.cache.close()
+        self.cache.set('api', 'twitter', [1, 2])
+        self.assertTrue(self.cache._get_cache_file('api', 'twitter').exists())
+
+    def test_set_snapshots_data_before_queueing(self):
+        """Test mutating data after set() does not change what reaches disk"""
+        payload = {'posts': [1]}
+        self.cache.set('api', 'reddit', payload)
+        payload['posts'].append(2)
+        self.cache.flush()
+
+        fresh = CacheManager(cache_dir=self.temp_dir)
+        self.assertEqual(fresh.get('api', 'reddit'), {'posts': [1]})
+        fresh.close()
+
+    def test_set_unserializable_data_is_not_cached(self):
+        """Test encoding errors are reported from set() and nothing is written"""
+        with self.assertLogs('utils.cache_manager', level='ERROR'):
+            self.cache.set('api', 'bad', {'handle': object()})
+        self.cache.flush()
+        self.assertFalse(self.cache._get_cache_file('api', 'bad').exists())
+
+    def test_managers_share_one_writer(self):
+        """Test managers share a single writer thread and stay collectable"""
+        extra = CacheManager(cache_dir=self.temp_dir)
+        self.cache.set('api', 'one', 1)
+        extra.set('api', 'two', 2)
+        extra.flush()
+        writers = [t for t in threading.enumerate() if t.name == 'cache-writer']
+        self.assertEqual(len(writers), 1)
+
+        ref = weakref.ref(extra)
+        del extra
+        gc.collect()
+        self.assertIsNone(ref())
+
+    def test_cache_stats_counts_files_by_type(self):
+        """Test get_cache_stats() reports per-type file counts"""
+        self.cache.set('api', 'reddit', {'a': 1})
+        self.cache.set('api', 'google', {'b': 2})
+        self.cache.set('summary', 'weekly', 'text')
+        self.cache.flush()
+        stats = self.cache.get_cache_stats()
+        self.assertEqual(stats['total_files'], 3)
+        self.assertEqual(stats['by_type']['api']['files'], 2)
+        self.assertEqual(stats['by_type']['summary']['files'], 1)
+        self.assertEqual(stats['by_type']['processed']['files'], 0)
+
+    def test_clear_expired_uses_file_age(self):
+        """Test clear_expired() removes only files older than the TTL"""
+        self.cache.set('api', 'old', 1)
+        self.cache.set('api', 'new', 2)
+        self.cache.flush()
+        old_file = self.cache._get_cache_file('api', 'old')
+        stale = time.time() - self.cache.default_ttl.total_seconds() - 60
+        os.utime(old_file, (stale, stale))
+
+        self.assertEqual(self.cache.clear_expired(), 1)
+        self.assertFalse(old_file.exists())
+        self.assertTrue(self.cache._get_cache_file('api', 'new').exists())
+
+    def test_clear_expired_removes_corrupt_files(self):
+        """Test clear_expired() deletes fresh files that cannot be decoded"""
+        self.cache.set('api', 'good', 1)
+        self.cache.flush()
+        corrupt = self.cache._get_cache_file('api', 'corrupt')
+        corrupt.write_bytes(b'\xff{not json')
+        missing_timestamp = self.cache._get_cache_file('api', 'partial')
+        missing_timestamp.write_text('{"data": 1}')
+
+        self.assertEqual(self.cache.clear_expired(), 2)
+        self.assertFalse(corrupt.exists())
+        self.assertFalse(missing_timestamp.exists())
+        self.assertTrue(self.cache._get_cache_file('api', 'good').exists())
+
+    def test_get_reads_back_from_disk(self):
+        """Test a fresh manager decodes entries written by another instance"""
+        payload = {'title': 'Cisco EoL notice', 'score': 4.5, 'tags': ['eol', None]}
+        self.cache.set('api', 'google', payload, {'q': 'cisco'})
+        self.cache.flush()
+
+        fresh = CacheManager(cache_dir=self.temp_dir)
+        self.assertEqual(fresh.get('api', 'google', {'q': 'cisco'}), payload)
+        fresh.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
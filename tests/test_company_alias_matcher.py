@@ -6,6 +6,8 @@ Validates vendor detection and alias matching functionality
 import unittest
 import sys
 import os
+import random
+import threading
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -26,7 +28,14 @@ class TestCompanyAliasMatcher(unittest.TestCase):
         self.assertGreater(len(self.matcher.company_mappings), 0)
         self.assertGreater(len(self.matcher.reverse_mappings), 0)
         self.assertGreater(len(self.matcher.compiled_patterns), 0)
-    
+
+    def test_instances_share_lookup_tables(self):
+        """Test lookup tables are built once and shared between instances"""
+        other = CompanyAliasMatcher(debug=True)
+        self.assertIs(other.compiled_patterns, self.matcher.compiled_patterns)
+        self.assertIs(other.reverse_mappings, self.matcher.reverse_mappings)
+        self.assertIsNot(other.alias_hit_counter, self.matcher.alias_hit_counter)
+
     def test_company_detection_exact_match(self):
         """Test exact company name detection"""
         text = "Microsoft Azure pricing increased by 15% this quarter"
@@ -83,6 +92,15 @@ class TestCompanyAliasMatcher(unittest.TestCase):
         # Test unknown company
         self.assertIsNone(self.matcher.normalize_company_name('unknown_vendor'))
     
+    def test_normalize_batch(self):
+        """Test batch normalization agrees with normalizing one name at a time"""
+        names = ['microsoft', 'Azure', 'vsphere', 'unknown_vendor', 'red hat', '']
+        self.assertEqual(
+            self.matcher.normalize_batch(names),
+            [self.matcher.normalize_company_name(name) for name in names]
+        )
+        self.assertEqual(self.matcher.normalize_batch([]), [])
+    
     def test_get_all_aliases(self):
         """Test retrieving aliases for companies"""
         microsoft_aliases = self.matcher.get_all_aliases_for_company('microsoft')
@@ -106,6 +124,15 @@ class TestCompanyAliasMatcher(unittest.TestCase):
         
         # Should have more keywords than input
         self.assertGreater(len(expanded), len(keywords))
+
+    def test_find_aliases_by_prefix(self):
+        """Test prefix lookup over names and aliases"""
+        matches = self.matcher.find_aliases_by_prefix('SAP ')
+
+        self.assertIn('sap hana', matches)
+        self.assertNotIn('sap', matches)
+        self.assertEqual(set(matches.values()), {'sap'})
+        self.assertEqual(self.matcher.find_aliases_by_prefix('zzz'), {})
     
     def test_company_relevance_scoring(self):
         """Test relevance scoring for specific companies"""
@@ -118,6 +145,25 @@ class TestCompanyAliasMatcher(unittest.TestCase):
         self.assertGreater(scores['microsoft'], 0)  # Should have high relevance
         self.assertEqual(scores['vmware'], 0)  # Should be zero (not mentioned)
         self.assertEqual(scores['cisco'], 0)  # Should be zero (not mentioned)
+
+        # A precomputed result gives the same scores
+        result = self.matcher.find_companies_in_text(text)
+        self.assertEqual(
+            self.matcher.get_company_relevance_score(text, target_companies, result=result), scores
+        )
+    
+    def test_relevance_scoring_without_full_scan(self):
+        """Test scoring only the targets agrees with scoring from a full result"""
+        text = "Red Hat subscriptions, VMware vSphere and VMW renewals; Cisco Meraki too"
+        target_companies = ['red hat', 'VMware', 'cisco', 'unknown vendor']
+
+        scores = self.matcher.get_company_relevance_score(text, target_companies)
+        fresh = CompanyAliasMatcher(result_cache_size=0)
+        result = fresh.find_companies_in_text(text)
+        self.assertEqual(
+            fresh.get_company_relevance_score(text, target_companies, result=result), scores
+        )
+        self.assertGreater(scores['vmware'], 0)
     
     def test_empty_text_handling(self):
         """Test handling of empty or invalid text"""
@@ -279,6 +325,158 @@ class TestCompanyAliasMatcherIntegration(unittest.TestCase):
         self.assertGreaterEqual(len(overlap), 2,
                               f"Expected distributors, detected: {detected_companies}")
 
+    def test_automaton_matches_regex_patterns(self):
+        """Test the single-pass automaton reproduces the per-company regex results"""
+        if self.matcher.automaton is None:
+            self.skipTest("pyahocorasick not installed")
+
+        texts = [
+            "Dell EMC PowerEdge and HPE GreenLake vs HP Inc laptops",
+            "Slack, Tableau and Salesforce: sales cloud pricing (SFDC)",
+            "pan-os upgrade on Palo Alto Networks; gpt-4 via OpenAI API",
+            "audio io_error radio scenario IO, Io-Link and ios",
+            "arrow_ecs arrowcloud Arrow ECS, arrow-cloud",
+        ]
+        for text in texts:
+            with self.subTest(text=text):
+                self.assertEqual(self.matcher._scan_automaton(text, text.lower()),
+                                 self.matcher._scan_regex(text))
+
+    def test_automaton_matches_regex_on_generated_text(self):
+        """Test automaton and regex agree on seeded random mixes of aliases and separators"""
+        if self.matcher.automaton is None:
+            self.skipTest("pyahocorasick not installed")
+
+        terms = [term for company, aliases in self.matcher.company_mappings.items()
+                 for term in [company] + aliases]
+        separators = [' ', '-', '_', '.', '', 'x', '1', '\u00e9', '\n']
+        rng = random.Random(72)
+        for _ in range(300):
+            words = [rng.choice([term, term.upper(), term.title(), term[:3]])
+                     for term in rng.choices(terms, k=rng.randint(1, 8))]
+            text = ''.join(word + rng.choice(separators) for word in words)
+            with self.subTest(text=text):
+                self.assertEqual(self.matcher._scan_automaton(text, text.lower()),
+                                 self.matcher._scan_regex(text))
+
+    def test_regex_fallback_matches_default_results(self):
+        """Test matching without the automaton gives the same results"""
+        fallback = CompanyAliasMatcher(debug=False)
+        fallback.automaton = None
+
+        texts = [
+            "Broadcom's VMware acquisition raised vSphere license costs",
+            "Palo Alto Networks PAN-OS and Prisma Cloud pricing",
+            "slack huddles vs Teams; Salesforce owns Slack",
+            "Café Dell-EMC über Cisco",
+        ]
+        for text in texts:
+            with self.subTest(text=text):
+                self.assertEqual(fallback.find_companies_in_text(text),
+                                 self.matcher.find_companies_in_text(text))
+
+    def test_batch_matches_single_text_results(self):
+        """Test find_companies_in_texts returns the same results as one call per text"""
+        texts = [
+            "Microsoft Azure pricing increased 15%",
+            "",
+            "Cisco Meraki licensing",
+            "LİCENSE change for VMware vSphere",
+            None,
+            "Dell EMC",
+        ]
+        batch = self.matcher.find_companies_in_texts(texts)
+
+        self.assertEqual(len(batch), len(texts))
+        for text, result in zip(texts, batch):
+            with self.subTest(text=text):
+                self.assertEqual(result, self.matcher.find_companies_in_text(text))
+
+    def test_fast_path_matches_full_result(self):
+        """Test find_companies_fast returns the companies of the full result"""
+        texts = [
+            "Microsoft Azure pricing increased 15%",
+            "",
+            "LİCENSE change for VMware vSphere",
+            "Broadcom closed the VMware deal; Dell EMC and HPE followed",
+        ]
+        for text in texts:
+            with self.subTest(text=text):
+                fast = self.matcher.find_companies_fast(text)
+                self.assertIsInstance(fast, frozenset)
+                self.assertEqual(fast, self.matcher.find_companies_in_text(text).matched_companies)
+
+    def test_longest_alias_wins(self):
+        """Test overlapping aliases resolve to the longest one"""
+        result = self.matcher.find_companies_in_text("SAP HANA migration and Dell EMC storage")
+
+        self.assertEqual(result.alias_hits['sap'], ['SAP HANA'])
+        self.assertEqual(result.alias_hits['dell'], ['Dell EMC'])
+
+    def test_repeated_text_served_from_result_cache(self):
+        """Test repeat scans reuse the cached result but still count debug hits"""
+        matcher = CompanyAliasMatcher(debug=True)
+        text = "Cisco Meraki renewal pricing"
+
+        first = matcher.find_companies_in_text(text)
+        second = matcher.find_companies_in_text(text)
+
+        self.assertIs(first, second)
+        self.assertEqual(matcher.match_stats['cisco'], 2 * first.total_matches)
+
+    def test_result_cache_can_be_disabled(self):
+        """Test result_cache_size=0 rescans every call"""
+        matcher = CompanyAliasMatcher(result_cache_size=0)
+        text = "Cisco Meraki renewal pricing"
+
+        first = matcher.find_companies_in_text(text)
+        second = matcher.find_companies_in_text(text)
+
+        self.assertIsNot(first, second)
+        self.assertEqual(first, second)
+        self.assertEqual(len(matcher._result_cache), 0)
+
+    def test_result_cache_shared_across_threads(self):
+        """Test concurrent lookups through one matcher keep the LRU consistent"""
+        matcher = CompanyAliasMatcher(result_cache_size=4)
+        texts = [f"Cisco quote {i} vs Dell EMC renewal" for i in range(20)]
+        expected = [matcher.find_companies_in_text(text).matched_companies for text in texts]
+        errors = []
+
+        def worker(seed):
+            rng = random.Random(seed)
+            try:
+                for _ in range(300):
+                    i = rng.randrange(len(texts))
+                    if matcher.find_companies_in_text(texts[i]).matched_companies != expected[i]:
+                        errors.append(i)
+            except Exception as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=worker, args=(seed,)) for seed in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertLessEqual(len(matcher._result_cache), 4)
+
+    def test_master_pattern_keeps_overlapping_mentions(self):
+        """Test the master pattern prefilter does not hide overlapping company matches"""
+        texts = [
+            "Slack huddles are bundled by Salesforce",
+            "arrow cloud volumes on NetApp",
+            "HP Enterprise and HPE Alletra",
+            "ſlack and Kelvin-ſign Katalyst",
+        ]
+        for text in texts:
+            with self.subTest(text=text):
+                expected = [(company, pattern.findall(text))
+                            for company, pattern in self.matcher.compiled_patterns.items()
+                            if pattern.search(text)]
+                self.assertEqual(self.matcher._scan_regex(text), expected)
+
 
 if __name__ == '__main__':
     # Create test suite
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Test suite for Employee Manager
+Validates employee CSV loading and keyword consolidation
+"""
+import unittest
+import sys
+import os
+import tempfile
+import shutil
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.employee_manager import EmployeeManager
+
+
+CSV_HEADER = "name,email,role,vendors,manufacturers,distributors,topics,active\n"
+
+
+class TestEmployeeManager(unittest.TestCase):
+    """Test cases for Employee Manager"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.csv_path = os.path.join(self.temp_dir, 'employees.csv')
+        self.write_csv(
+            'Ann Lee,ann@company.com,pricing_analyst,"microsoft,cisco",fortinet,"td synnex",pricing,true\n'
+            'Bob Ray,bob@company.com,procurement_manager,dell,"cisco",cdw,"procurement,pricing",true\n'
+            'Cy Fox,cy@company.com,pricing_analyst,hp,,,,false\n'
+        )
+        self.manager = EmployeeManager(self.csv_path)
+
+    def tearDown(self):
+        """Clean up test fixtures"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def write_csv(self, rows):
+        with open(self.csv_path, 'w') as f:
+            f.write(CSV_HEADER + rows)
+
+    def test_loads_only_active_employees(self):
+        """Test inactive rows are skipped"""
+        self.assertEqual([emp.name for emp in self.manager.employees], ['Ann Lee', 'Bob Ray'])
+        self.assertEqual(len(self.manager.get_active_employees()), 2)
+
+    def test_keyword_weight_follows_category_priority(self):
+        """Test a keyword takes the weight of its highest-priority category"""
+        ann, bob = self.manager.employees
+        weights = self.manager.keyword_weights
+
+        self.assertEqual(ann.weight_map['pricing'], weights['topics'])
+        self.assertEqual(ann.weight_map['cisco'], weights['vendors'])
+        self.assertEqual(bob.weight_map['cisco'], weights['manufacturers'])
+        self.assertEqual(set(ann.weight_map), set(ann.combined_keywords))
+
+    def test_expanded_aliases_get_default_weight(self):
+        """Test keywords reached only through alias expansion weigh 0.5"""
+        ann = self.manager.employees[0]
+        expanded = [kw for kw in ann.combined_keywords
+                    if kw not in ann.vendors + ann.manufacturers + ann.distributors + ann.topics]
+
+        self.assertTrue(expanded)
+        for keyword in expanded:
+            self.assertEqual(ann.weight_map[keyword], 0.5)
+
+    def test_consolidated_weights_keep_maximum(self):
+        """Test consolidation keeps the highest weight seen across employees"""
+        weighted = self.manager.get_weighted_keywords()
+
+        self.assertEqual(weighted['pricing'], 1.0)
+        self.assertEqual(weighted['cisco'], 0.9)
+        self.assertEqual(weighted['cdw'], 0.6)
+        # Keywords come back in first-seen order, so repeated loads agree
+        self.assertEqual(self.manager.get_all_keywords(), list(weighted))
+
+    def test_lookup_by_email_and_role(self):
+        """Test email and role lookups over the loaded employees"""
+        self.assertEqual(self.manager.get_employee_by_email('bob@company.com').name, 'Bob Ray')
+        self.assertIsNone(self.manager.get_employee_by_email('cy@company.com'))
+        self.assertEqual([emp.name for emp in self.manager.get_employees_by_role('pricing_analyst')],
+                         ['Ann Lee'])
+        self.assertEqual(self.manager.get_employees_by_role('bi_strategy'), [])
+
+    def test_missing_fields_loads_nobody(self):
+        """Test a CSV without the required columns is rejected"""
+        with open(self.csv_path, 'w') as f:
+            f.write("name,email\nAnn Lee,ann@company.com\n")
+        manager = EmployeeManager(self.csv_path)
+
+        self.assertEqual(manager.employees, [])
+        self.assertIsNone(manager.consolidated_keywords)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -191,14 +191,19 @@ class TestGPTSummarizer(unittest.TestCase):
         self.assertIn('content to analyze', prompt.lower())
         self.assertIn(content, prompt)
     
-    @patch('openai.ChatCompletion.create')
-    def test_generate_summary_success(self, mock_openai):
+    def _mock_chat_completion(self, content: str) -> Mock:
+        """Patch openai.ChatCompletion.create to return a single-choice response for this test"""
+        mock_response = Mock()
+        mock_response.choices = [Mock(message=Mock(content=content))]
+        patcher = patch('openai.ChatCompletion.create', return_value=mock_response)
+        mock_create = patcher.start()
+        self.addCleanup(patcher.stop)
+        return mock_create
+    
+    def test_generate_summary_success(self):
         """Test successful summary generation"""
         # Mock successful OpenAI response
-        mock_response = Mock()
-        mock_response.choices = [Mock()]
-        mock_response.choices[0].message = Mock()
-        mock_response.choices[0].message.content = json.dumps({
+        self._mock_chat_completion(json.dumps({
             "role_summaries": {
                 "pricing_profitability_team": {
                     "role": "Pricing Profitability Team",
@@ -210,8 +215,7 @@ class TestGPTSummarizer(unittest.TestCase):
             },
             "by_urgency": {"high": 1, "medium": 1, "low": 0},
             "total_items": 2
-        })
-        mock_openai.return_value = mock_response
+        }))
         
         # Test with API key
         with patch.dict(os.environ, {'OPENAI_API_KEY': 'test-key'}):
@@ -8,7 +8,9 @@ import sys
 import os
 import tempfile
 from datetime import datetime
+from unittest import mock
 from bs4 import BeautifulSoup
+from pyfakefs import fake_filesystem_unittest
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -16,21 +18,30 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from html_generator import EnhancedHTMLGenerator, generate_and_save_report
 
 
+class _FrozenDatetime(datetime):
+    """datetime whose now() is fixed, so two renders of a report are identical"""
+    
+    @classmethod
+    def now(cls, tz=None):
+        return cls(2024, 6, 15, 9, 30, 0)
+
+
 class TestEnhancedHTMLGenerator(unittest.TestCase):
     """Test cases for Enhanced HTML Generator"""
     
-    def setUp(self):
-        """Set up test fixtures"""
-        self.generator = EnhancedHTMLGenerator(debug=False)
+    @classmethod
+    def setUpClass(cls):
+        """Set up shared test fixtures once for the whole class (tests only read them)"""
+        cls.generator = EnhancedHTMLGenerator(debug=False)
         
         # Sample test data
-        self.sample_insights = [
+        cls.sample_insights = [
             "🔴 Microsoft Office 365 pricing increased 15% affecting enterprise customers",
             "🟡 VMware licensing changes driving migration to alternatives",
             "🟢 Dell server pricing remains stable despite supply chain pressures"
         ]
         
-        self.sample_content = [
+        cls.sample_content = [
             {
                 'title': 'Microsoft Pricing Update',
                 'content': 'Enterprise licensing costs increasing',
@@ -49,17 +60,17 @@ class TestEnhancedHTMLGenerator(unittest.TestCase):
             }
         ]
         
-        self.sample_vendor_analysis = {
+        cls.sample_vendor_analysis = {
             'top_vendors': [('microsoft', 3), ('vmware', 2), ('dell', 1)],
             'total_vendors': 3,
             'vendor_mentions': {'microsoft': 3, 'vmware': 2, 'dell': 1}
         }
         
-        self.sample_config = {
+        cls.sample_config = {
             'system': {'name': 'ULTRATHINK-AI-PRO', 'version': '3.1.0'}
         }
         
-        self.sample_performance_metrics = {
+        cls.sample_performance_metrics = {
             'summary': {
                 'total_runtime': 45.2,
                 'success_rate': 0.95,
@@ -67,6 +78,16 @@ class TestEnhancedHTMLGenerator(unittest.TestCase):
                 'total_data_processed': 150
             }
         }
+        
+        # Render the sample report once; structure/CSS tests share it
+        cls.html_content = cls.generator.generate_html_report(
+            insights=cls.sample_insights,
+            all_content=cls.sample_content,
+            vendor_analysis=cls.sample_vendor_analysis,
+            config=cls.sample_config,
+            performance_metrics=cls.sample_performance_metrics
+        )
+        cls.soup = BeautifulSoup(cls.html_content, 'html.parser')
     
     def test_initialization(self):
         """Test generator initialization"""
@@ -97,6 +118,22 @@ class TestEnhancedHTMLGenerator(unittest.TestCase):
         self.assertEqual(len(categorized['beta']), 1)   # 🟡 medium priority
         self.assertEqual(len(categorized['gamma']), 1)  # 🟢 low priority
     
+    def test_insights_categorization_keyword_tiers(self):
+        """Test priority keywords are matched case-insensitively with alpha taking precedence"""
+        alpha_dict = {'text': 'Emergency patch pricing for Cisco'}
+        insights = [
+            'urgent and important: Dell renewal deadline',
+            alpha_dict,
+            'Notable VMware bundle change',
+            'MONITORING: Lenovo supply watch',
+            'Quarterly channel recap'
+        ]
+        categorized = self.generator._categorize_insights_by_priority(insights)
+        
+        self.assertEqual(categorized['alpha'], [insights[0], alpha_dict])
+        self.assertEqual(categorized['beta'], ['Notable VMware bundle change'])
+        self.assertEqual(categorized['gamma'], ['MONITORING: Lenovo supply watch', 'Quarterly channel recap'])
+    
     def test_vendor_stats_generation(self):
         """Test vendor statistics generation"""
         vendor_stats = self.generator._generate_vendor_stats(self.sample_vendor_analysis, self.sample_content)
@@ -111,50 +148,32 @@ class TestEnhancedHTMLGenerator(unittest.TestCase):
     
     def test_html_report_generation(self):
         """Test complete HTML report generation"""
-        html_content = self.generator.generate_html_report(
-            insights=self.sample_insights,
-            all_content=self.sample_content,
-            vendor_analysis=self.sample_vendor_analysis,
-            config=self.sample_config,
-            performance_metrics=self.sample_performance_metrics
-        )
-        
-        self.assertIsInstance(html_content, str)
-        self.assertGreater(len(html_content), 1000)  # Should be substantial
-        
-        # Parse HTML to validate structure
-        soup = BeautifulSoup(html_content, 'html.parser')
+        self.assertIsInstance(self.html_content, str)
+        self.assertGreater(len(self.html_content), 1000)  # Should be substantial
         
         # Test basic HTML structure
-        self.assertIsNotNone(soup.find('html'))
-        self.assertIsNotNone(soup.find('head'))
-        self.assertIsNotNone(soup.find('body'))
+        for tag in ('html', 'head', 'body'):
+            with self.subTest(tag=tag):
+                self.assertIsNotNone(self.soup.find(tag))
         
         # Test required meta tags (mobile responsiveness)
-        viewport_meta = soup.find('meta', attrs={'name': 'viewport'})
-        self.assertIsNotNone(viewport_meta, "Missing viewport meta tag for mobile responsiveness")
-        
-        charset_meta = soup.find('meta', attrs={'charset': True})
-        self.assertIsNotNone(charset_meta, "Missing charset meta tag")
-        
-        description_meta = soup.find('meta', attrs={'name': 'description'})
-        self.assertIsNotNone(description_meta, "Missing description meta tag")
+        required_meta = [
+            ({'name': 'viewport'}, "Missing viewport meta tag for mobile responsiveness"),
+            ({'charset': True}, "Missing charset meta tag"),
+            ({'name': 'description'}, "Missing description meta tag"),
+        ]
+        for attrs, reason in required_meta:
+            with self.subTest(meta=attrs):
+                self.assertIsNotNone(self.soup.find('meta', attrs=attrs), reason)
     
     def test_accessibility_features(self):
         """Test accessibility features in generated HTML"""
-        html_content = self.generator.generate_html_report(
-            insights=self.sample_insights,
-            all_content=self.sample_content,
-            vendor_analysis=self.sample_vendor_analysis,
-            config=self.sample_config
-        )
-        
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = self.soup
         
         # Test semantic HTML elements
-        self.assertIsNotNone(soup.find('main'), "Missing main element")
-        self.assertIsNotNone(soup.find('header'), "Missing header element") 
-        self.assertIsNotNone(soup.find('footer'), "Missing footer element")
+        for tag in ('main', 'header', 'footer'):
+            with self.subTest(tag=tag):
+                self.assertIsNotNone(soup.find(tag), f"Missing {tag} element")
         
         # Test ARIA labels and roles
         main_element = soup.find('main')
@@ -176,25 +195,20 @@ class TestEnhancedHTMLGenerator(unittest.TestCase):
     
     def test_mobile_responsive_css(self):
         """Test mobile responsive CSS in generated HTML"""
-        html_content = self.generator.generate_html_report(
-            insights=self.sample_insights,
-            all_content=self.sample_content,
-            vendor_analysis=self.sample_vendor_analysis,
-            config=self.sample_config
-        )
-        
-        # Test for mobile responsive CSS
-        self.assertIn('@media (max-width: 768px)', html_content, "Missing tablet responsive CSS")
-        self.assertIn('@media (max-width: 480px)', html_content, "Missing mobile responsive CSS")
-        self.assertIn('@media print', html_content, "Missing print styles")
-        
-        # Test for accessibility CSS
-        self.assertIn('@media (prefers-contrast: high)', html_content, "Missing high contrast CSS")
-        self.assertIn('@media (prefers-reduced-motion', html_content, "Missing reduced motion CSS")
-        
-        # Test for responsive grid
-        self.assertIn('grid-template-columns', html_content, "Missing responsive grid CSS")
-        self.assertIn('auto-fit', html_content, "Missing auto-fit grid property")
+        required_css = [
+            ('@media (max-width: 768px)', "Missing tablet responsive CSS"),
+            ('@media (max-width: 480px)', "Missing mobile responsive CSS"),
+            ('@media print', "Missing print styles"),
+            # Accessibility CSS
+            ('@media (prefers-contrast: high)', "Missing high contrast CSS"),
+            ('@media (prefers-reduced-motion', "Missing reduced motion CSS"),
+            # Responsive grid
+            ('grid-template-columns', "Missing responsive grid CSS"),
+            ('auto-fit', "Missing auto-fit grid property"),
+        ]
+        for snippet, reason in required_css:
+            with self.subTest(css=snippet):
+                self.assertIn(snippet, self.html_content, reason)
     
     def test_insights_section_generation(self):
         """Test insights section HTML generation"""
@@ -295,12 +309,7 @@ class TestEnhancedHTMLGenerator(unittest.TestCase):
     
     def test_save_html_report(self):
         """Test saving HTML report to file"""
-        html_content = self.generator.generate_html_report(
-            insights=self.sample_insights,
-            all_content=self.sample_content,
-            vendor_analysis=self.sample_vendor_analysis,
-            config=self.sample_config
-        )
+        html_content = self.html_content
         
         # Use temporary directory for testing
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -320,6 +329,51 @@ class TestEnhancedHTMLGenerator(unittest.TestCase):
             self.assertTrue(filename.startswith('ultrathink_enhanced_'))
             self.assertTrue(filename.endswith('.html'))
     
+    def test_streamed_report_matches_string(self):
+        """Test streaming the report to a file writes exactly the string report"""
+        report_args = dict(
+            insights=self.sample_insights,
+            all_content=self.sample_content,
+            vendor_analysis=self.sample_vendor_analysis,
+            config=self.sample_config,
+            performance_metrics=self.sample_performance_metrics
+        )
+        
+        with mock.patch('html_generator.datetime', _FrozenDatetime):
+            expected = self.generator.generate_html_report(**report_args)
+            with tempfile.TemporaryDirectory() as temp_dir:
+                filepath = os.path.join(temp_dir, 'report.html')
+                self.assertEqual(self.generator.write_html_report(filepath, **report_args), filepath)
+                
+                with open(filepath, 'r', encoding='utf-8') as f:
+                    self.assertEqual(f.read(), expected)
+                
+                # The temp file has been renamed into place
+                self.assertEqual(os.listdir(temp_dir), ['report.html'])
+    
+    def test_failed_render_leaves_no_partial_report(self):
+        """Test a rendering error keeps the previous report and removes the temp file"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            filepath = os.path.join(temp_dir, 'report.html')
+            with open(filepath, 'w', encoding='utf-8') as f:
+                f.write('previous report')
+            
+            # Fails after the head and insights have already been streamed
+            with mock.patch.object(self.generator, '_generate_methodology_section',
+                                   side_effect=RuntimeError('render failed')):
+                with self.assertRaises(RuntimeError):
+                    self.generator.write_html_report(
+                        filepath,
+                        insights=self.sample_insights,
+                        all_content=self.sample_content,
+                        vendor_analysis=self.sample_vendor_analysis,
+                        config=self.sample_config
+                    )
+            
+            with open(filepath, 'r', encoding='utf-8') as f:
+                self.assertEqual(f.read(), 'previous report')
+            self.assertEqual(os.listdir(temp_dir), ['report.html'])
+    
     def test_empty_insights_handling(self):
         """Test handling of empty insights"""
         empty_html = self.generator._generate_insights_section([], 'alpha', 'Priority Alpha')
@@ -347,6 +401,18 @@ class TestEnhancedHTMLGenerator(unittest.TestCase):
         highlighted_spans = soup.find_all('span', style=True)
         self.assertGreater(len(highlighted_spans), 0)
     
+    def test_vendor_highlighting_matches_whole_names(self):
+        """Test vendors are highlighted once each, as whole words, keeping their case"""
+        highlighted = self.generator._highlight_vendors(
+            "HPE and hp pricing moved; Dellwood Consulting is not a vendor")
+        
+        soup = BeautifulSoup(highlighted, 'html.parser')
+        spans = [span.get_text() for span in soup.find_all('span', class_='vendor-highlight')]
+        
+        # 'HPE' is not split by the shorter 'HP' and 'Dell' inside 'Dellwood' is skipped
+        self.assertEqual(spans, ['HPE', 'hp'])
+        self.assertIn('Dellwood Consulting', soup.get_text())
+    
     def test_confidence_assessment(self):
         """Test insight confidence assessment"""
         # High confidence (specific data)
@@ -365,8 +431,12 @@ class TestEnhancedHTMLGenerator(unittest.TestCase):
         self.assertEqual(default_conf['level'], 'Moderate Confidence')
 
 
-class TestHTMLGeneratorIntegration(unittest.TestCase):
-    """Integration tests for HTML Generator"""
+class TestHTMLGeneratorIntegration(fake_filesystem_unittest.TestCase):
+    """Integration tests for HTML Generator (run against an in-memory filesystem)"""
+    
+    def setUp(self):
+        """Swap the real filesystem for pyfakefs"""
+        self.setUpPyfakefs()
     
     def test_generate_and_save_report_function(self):
         """Test the convenience function for generating and saving reports"""
@@ -375,30 +445,30 @@ class TestHTMLGeneratorIntegration(unittest.TestCase):
         sample_vendor_analysis = {'top_vendors': [], 'total_vendors': 0, 'vendor_mentions': {}}
         sample_config = {'system': {'name': 'ULTRATHINK-AI-PRO'}}
         
-        with tempfile.TemporaryDirectory() as temp_dir:
-            saved_file = generate_and_save_report(
-                insights=sample_insights,
-                all_content=sample_content,
-                vendor_analysis=sample_vendor_analysis,
-                config=sample_config,
-                output_dir=temp_dir
-            )
-            
-            # Verify file exists and is valid HTML
-            self.assertTrue(os.path.exists(saved_file))
-            
-            with open(saved_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Basic HTML validation
-            soup = BeautifulSoup(content, 'html.parser')
-            self.assertIsNotNone(soup.find('html'))
-            self.assertIsNotNone(soup.find('head'))
-            self.assertIsNotNone(soup.find('body'))
-            
-            # Test our improvements are present
-            self.assertIsNotNone(soup.find('meta', attrs={'name': 'viewport'}))
-            self.assertIsNotNone(soup.find('main'))
+        saved_file = generate_and_save_report(
+            insights=sample_insights,
+            all_content=sample_content,
+            vendor_analysis=sample_vendor_analysis,
+            config=sample_config,
+            output_dir='/reports'
+        )
+        
+        # Verify file exists and is valid HTML
+        self.assertTrue(os.path.exists(saved_file))
+        self.assertEqual(os.path.dirname(saved_file), '/reports')
+        
+        with open(saved_file, 'r', encoding='utf-8') as f:
+            content = f.read()
+        
+        # Basic HTML validation
+        soup = BeautifulSoup(content, 'html.parser')
+        self.assertIsNotNone(soup.find('html'))
+        self.assertIsNotNone(soup.find('head'))
+        self.assertIsNotNone(soup.find('body'))
+        
+        # Test our improvements are present
+        self.assertIsNotNone(soup.find('meta', attrs={'name': 'viewport'}))
+        self.assertIsNotNone(soup.find('main'))
     
     def test_large_content_handling(self):
         """Test handling of large amounts of content"""
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Test suite for Performance Monitor
+Validates timer bookkeeping and the monitor_performance decorator
+"""
+import unittest
+import sys
+import os
+import asyncio
+import time
+from unittest import mock
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# psutil is not part of the minimal requirements
+try:
+    from utils.performance_monitor import PerformanceMonitor, monitor_performance
+    PERFORMANCE_MONITOR_AVAILABLE = True
+except ImportError:
+    PERFORMANCE_MONITOR_AVAILABLE = False
+
+
+@unittest.skipUnless(PERFORMANCE_MONITOR_AVAILABLE, "psutil not installed")
+class TestMonitorPerformance(unittest.TestCase):
+    """Test cases for the monitor_performance decorator"""
+
+    def test_concurrent_async_calls_are_timed_separately(self):
+        """Test that overlapping awaits each record their own duration"""
+        @monitor_performance("fetch")
+        async def fetch(delay):
+            await asyncio.sleep(delay)
+            return delay
+
+        async def run():
+            return await asyncio.gather(fetch(0.2), fetch(0.05))
+
+        self.assertEqual(asyncio.run(run()), [0.2, 0.05])
+
+        samples = fetch.get_monitor().metrics["fetch"]
+        self.assertEqual(len(samples), 2)
+        short, long_ = sorted(record['duration'] for record in samples.iter_records())
+        self.assertGreaterEqual(short, 0.05)
+        self.assertLess(short, 0.15)
+        self.assertGreaterEqual(long_, 0.2)
+        self.assertEqual(fetch.get_monitor().active_timers, {})
+
+    def test_failed_call_is_timed_and_counted(self):
+        """Test that an exception still records a sample and an error"""
+        @monitor_performance("explode")
+        def explode():
+            time.sleep(0.01)
+            raise RuntimeError("boom")
+
+        with self.assertRaises(RuntimeError):
+            explode()
+
+        monitor = explode.get_monitor()
+        self.assertEqual(len(monitor.metrics["explode"]), 1)
+        self.assertEqual(monitor.error_counts["explode"], 1)
+
+
+@unittest.skipUnless(PERFORMANCE_MONITOR_AVAILABLE, "psutil not installed")
+class TestPerformanceMonitor(unittest.TestCase):
+    """Test cases for PerformanceMonitor"""
+
+    def test_system_sampling_keeps_timer_cpu_baseline(self):
+        """Test the sampling loop reads CPU from its own process handle"""
+        monitor = PerformanceMonitor()
+        monitor._proc = mock.Mock(wraps=monitor._proc)
+
+        monitor._capture_system_metrics()
+
+        monitor._proc.cpu_percent.assert_not_called()
+        monitor._proc.as_dict.assert_not_called()
+
+    def test_timer_samples_keep_newest_in_order(self):
+        """Test a full sample buffer drops the oldest and exports oldest first"""
+        monitor = PerformanceMonitor(max_samples=3)
+        for i in range(5):
+            monitor.record_duration("op", float(i))
+
+        samples = monitor.metrics["op"]
+        self.assertEqual(len(samples), 3)
+        self.assertEqual([record['duration'] for record in samples.iter_records()], [2.0, 3.0, 4.0])
+        self.assertEqual(samples.count, 5)
+        self.assertEqual(samples.min_time, 0.0)
+
+        summary = monitor.get_performance_summary()["operation_metrics"]["op"]
+        self.assertEqual(summary["max_time"], 4.0)
+        self.assertEqual(summary["last_run"], list(samples.iter_records())[-1]["timestamp"])
+
+
+if __name__ == '__main__':
+    unittest.main()
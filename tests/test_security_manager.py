@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Test suite for Security Manager
+Validates input sanitization, credential checks and rate limiting
+"""
+import unittest
+import sys
+import os
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import security_manager
+from utils.security_manager import (
+    InputValidator, RateLimiter, SecureCredentialManager, SecurityError, secure_api_call
+)
+
+
+class TestInputValidator(unittest.TestCase):
+    """Test cases for Input Validator"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.validator = InputValidator()
+
+    def test_sanitize_url_accepts_regular_urls(self):
+        """Test ordinary http(s) URLs pass through unchanged"""
+        for url in ('https://www.reddit.com/r/sysadmin/comments/abc/some_title/',
+                    'http://example.com:8080/path?q=1&page=2#top',
+                    'https://news.example.co.uk'):
+            self.assertEqual(self.validator.sanitize_url(url), url)
+
+    def test_sanitize_url_rejects_malformed_urls(self):
+        """Test non-http schemes, bad hosts and embedded credentials are rejected"""
+        for url in ('ftp://example.com/file',
+                    'http://localhost/admin',
+                    'https://example.com/a b',
+                    'http://example.com@evil.com/login'):
+            self.assertIsNone(self.validator.sanitize_url(url))
+
+    def test_sanitize_url_blocks_suspicious_domains(self):
+        """Test suspicious hosts and their subdomains are blocked by hostname"""
+        for url in ('https://bit.ly/abc', 'https://BIT.LY/abc', 'http://go.tinyurl.com/x'):
+            self.assertIsNone(self.validator.sanitize_url(url))
+        for url in ('https://notbit.ly.example.com/page', 'https://example.com/?via=bit.ly'):
+            self.assertEqual(self.validator.sanitize_url(url), url)
+
+    def test_sanitize_url_long_host_is_rejected(self):
+        """Test a long invalid host is rejected rather than backtracking"""
+        url = 'http://' + 'a.aa' * 4000 + ' '
+        self.assertIsNone(self.validator.sanitize_url(url))
+
+    def test_sanitize_text_blocks_sql_injection(self):
+        """Test text matching any SQL injection check is dropped"""
+        for text in ("1' OR 1=1", 'UNION SELECT password', "x'; shutdown --",
+                     'name; DROP users', 'EXEC (xp_cmdshell)', '\u017felect * from users'):
+            self.assertEqual(self.validator.sanitize_text(text), '')
+
+    def test_sanitize_text_strips_script_tags(self):
+        """Test script blocks are removed and benign text survives"""
+        text = '  Dell <script type="x">alert(1)</script>pricing update  '
+        self.assertEqual(self.validator.sanitize_text(text), 'Dell pricing update')
+        self.assertEqual(self.validator.sanitize_text('Please select a vendor from the list'),
+                         'Please select a vendor from the list')
+
+    def test_validate_subreddit_and_email(self):
+        """Test subreddit names and email addresses are format-checked"""
+        self.assertTrue(self.validator.validate_subreddit_name('sysadmin'))
+        self.assertFalse(self.validator.validate_subreddit_name('sys-admin'))
+        self.assertFalse(self.validator.validate_subreddit_name('a' * 22))
+        self.assertTrue(InputValidator.validate_email('ann@company.com'))
+        self.assertFalse(InputValidator.validate_email('ann@company'))
+        self.assertFalse(self.validator.validate_subreddit_name('sysadmin\n'))
+        self.assertFalse(InputValidator.validate_email('ann@company.com\n'))
+
+
+class TestSecureCredentialManager(unittest.TestCase):
+    """Test cases for Secure Credential Manager"""
+
+    def test_validate_api_key_repeat_calls(self):
+        """Test cached validations still honour the format check"""
+        good_key = 'sk-' + 'a' * 40
+        for _ in range(2):
+            self.assertTrue(SecureCredentialManager.validate_api_key('openai', good_key))
+            self.assertFalse(SecureCredentialManager.validate_api_key('openai', 'bad-key'))
+        self.assertFalse(SecureCredentialManager.validate_api_key('openai', None))
+
+    def test_validate_api_key_uses_config_patterns(self):
+        """Test a key validated under one pattern is rechecked under another"""
+        key = 'sk-' + 'b' * 30
+        strict = {'security': {'api_key_patterns': {'openai': r'^sk-[0-9]+$'}}}
+        self.assertTrue(SecureCredentialManager.validate_api_key('openai', key))
+        self.assertFalse(SecureCredentialManager.validate_api_key('openai', key, strict))
+
+
+class TestRateLimiter(unittest.TestCase):
+    """Test cases for Rate Limiter"""
+
+    def test_blocks_once_window_is_full(self):
+        """Test calls are refused after max_calls within the window"""
+        limiter = RateLimiter(max_calls=2, time_window=60)
+        for _ in range(2):
+            self.assertTrue(limiter.can_make_call())
+            limiter.record_call()
+        self.assertFalse(limiter.can_make_call())
+
+    def test_expired_calls_free_capacity(self):
+        """Test calls older than the window no longer count"""
+        limiter = RateLimiter(max_calls=1, time_window=0.05)
+        limiter.record_call()
+        self.assertFalse(limiter.can_make_call())
+        time.sleep(0.1)
+        self.assertTrue(limiter.can_make_call())
+
+
+
+class TestSecureApiCall(unittest.TestCase):
+    """Test cases for the secure_api_call decorator"""
+
+    def setUp(self):
+        """Start each test from a fresh global security manager"""
+        self._saved_manager = security_manager._security_manager
+        security_manager._security_manager = None
+
+    def tearDown(self):
+        security_manager._security_manager = self._saved_manager
+
+    def test_decorated_functions_share_service_limit(self):
+        """Test calls through different decorated functions count together"""
+        config = {'security': {'rate_limits': {'openai': {'max_calls': 2, 'time_window': 60}}}}
+        security_manager.get_security_manager(config)
+
+        @secure_api_call('openai')
+        def first():
+            return 'first'
+
+        @secure_api_call('openai')
+        def second():
+            return 'second'
+
+        self.assertEqual(first(), 'first')
+        self.assertEqual(second(), 'second')
+        with self.assertRaises(SecurityError):
+            first()
+
+if __name__ == '__main__':
+    unittest.main()
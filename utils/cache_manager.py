@@ -6,22 +6,132 @@ Reduces API calls and improves performance
 import json
 import hashlib
 import os
+import atexit
+import queue
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, Optional
 from pathlib import Path
 import logging
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Param value types that can be keyed without going through json.dumps
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+def _dumps_cache_entry(cache_data: Dict[str, Any]) -> bytes:
+    """Encode a cache entry as indented JSON, with orjson when available"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(cache_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits; the stdlib encoder accepts them
+    return json.dumps(cache_data, indent=2).encode()
+
+
+def _loads_cache_entry(payload: bytes) -> Dict[str, Any]:
+    """Decode a cache entry, with orjson when available"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(payload)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN written by the stdlib encoder
+    return json.loads(payload)
+
+
+def _write_cache_file(cache_file: Path, payload: bytes, identifier: str) -> None:
+    """Atomically write an encoded cache entry (temp file + rename)"""
+    tmp_file = cache_file.with_name(cache_file.name + ".tmp")
+    try:
+        with open(tmp_file, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_file, cache_file)
+        logger.debug(f"Cached data for {identifier}")
+    except Exception as e:
+        logger.error(f"Error caching data for {identifier}: {e}")
+
+
+class _CacheWriter:
+    """Background thread, shared by every CacheManager, that drains queued disk writes"""
+    
+    def __init__(self):
+        self._queue: queue.Queue = queue.Queue()  # (path, payload, identifier) or None to stop
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+    
+    def submit(self, cache_file: Path, payload: bytes, identifier: str) -> bool:
+        """Queue a write, starting the thread on first use; False once stopped"""
+        with self._lock:
+            if self._stopped:
+                return False
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="cache-writer", daemon=True)
+                self._thread.start()
+            self._queue.put((cache_file, payload, identifier))
+        return True
+    
+    def flush(self) -> None:
+        """Block until every queued write has reached disk"""
+        self._queue.join()
+    
+    def stop(self) -> None:
+        """Drain pending writes and stop the thread; later writes happen inline"""
+        with self._lock:
+            if self._stopped:
+                return
+            self._stopped = True
+            thread = self._thread
+        if thread is not None:
+            self._queue.put(None)
+            thread.join()
+    
+    def _run(self) -> None:
+        """Drain queued writes until the shutdown sentinel is received"""
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                _write_cache_file(*item)
+            finally:
+                self._queue.task_done()
+
+
+# One writer for the whole process; registering it (not each manager) with
+# atexit keeps managers collectable and caps the process at one writer thread
+_writer = _CacheWriter()
+atexit.register(_writer.stop)
+
 
 class CacheManager:
     """Manages caching for API responses and processed data"""
     
-    def __init__(self, cache_dir: str = "cache", default_ttl_hours: int = 24):
+    def __init__(self, cache_dir: str = "cache", default_ttl_hours: int = 24, memory_size: int = 256):
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(exist_ok=True)
         self.default_ttl = timedelta(hours=default_ttl_hours)
         
+        # In-process LRU layer in front of the disk cache, keyed by cache file path.
+        # It holds encoded entries so every hit decodes a private copy, and is
+        # locked so managers can be shared between threads
+        self.memory_size = memory_size
+        self._mem: OrderedDict = OrderedDict()  # path -> (timestamp, payload)
+        self._mem_lock = threading.Lock()
+        
+        # Disk writes go through the shared background writer so set() never
+        # blocks on I/O; once closed, this manager writes synchronously
+        self._closed = False
+        
         # Create subdirectories for different cache types
         self.api_cache_dir = self.cache_dir / "api"
         self.processed_cache_dir = self.cache_dir / "processed"
@@ -29,28 +139,50 @@ class CacheManager:
         
         for dir in [self.api_cache_dir, self.processed_cache_dir, self.summary_cache_dir]:
             dir.mkdir(exist_ok=True)
+        
+        # Built once: resolved on every get()/set()
+        self._cache_paths = {
+            'api': self.api_cache_dir,
+            'processed': self.processed_cache_dir,
+            'summary': self.summary_cache_dir
+        }
     
     def _generate_cache_key(self, identifier: str, params: Dict[str, Any] = None) -> str:
         """Generate a unique cache key based on identifier and parameters"""
         cache_string = identifier
         if params:
-            # Sort params for consistent hashing
-            sorted_params = json.dumps(params, sort_keys=True)
-            cache_string += sorted_params
+            if all(isinstance(v, _SCALAR_TYPES) for v in params.values()):
+                # Flat params: skip the JSON encoder; repr keeps 1 and "1" distinct
+                cache_string += "|" + "|".join(f"{k}={params[k]!r}" for k in sorted(params))
+            else:
+                # Sort params for consistent hashing
+                sorted_params = json.dumps(params, sort_keys=True)
+                cache_string += sorted_params
         
         return hashlib.md5(cache_string.encode()).hexdigest()
     
     def get(self, cache_type: str, identifier: str, params: Dict[str, Any] = None) -> Optional[Any]:
         """Retrieve cached data if valid"""
-        cache_key = self._generate_cache_key(identifier, params)
-        cache_file = self._get_cache_path(cache_type) / f"{cache_key}.json"
+        cache_file = self._get_cache_file(cache_type, identifier, params)
+        
+        with self._mem_lock:
+            entry = self._mem.get(cache_file)
+            if entry is not None:
+                if datetime.now() - entry[0] <= self.default_ttl:
+                    self._mem.move_to_end(cache_file)
+                else:
+                    del self._mem[cache_file]
+                    entry = None
+        if entry is not None:
+            logger.debug(f"Memory cache hit for {identifier}")
+            return _loads_cache_entry(entry[1])['data']
         
         if not cache_file.exists():
             return None
         
         try:
-            with open(cache_file, 'r') as f:
-                cache_data = json.load(f)
+            payload = cache_file.read_bytes()
+            cache_data = _loads_cache_entry(payload)
             
             # Check if cache is expired
             cached_time = datetime.fromisoformat(cache_data['timestamp'])
@@ -60,6 +192,7 @@ class CacheManager:
                 return None
             
             logger.debug(f"Cache hit for {identifier}")
+            self._remember(cache_file, cached_time, payload)
             return cache_data['data']
             
         except Exception as e:
@@ -68,49 +201,96 @@ class CacheManager:
     
     def set(self, cache_type: str, identifier: str, data: Any, params: Dict[str, Any] = None) -> None:
         """Cache data with timestamp"""
-        cache_key = self._generate_cache_key(identifier, params)
-        cache_file = self._get_cache_path(cache_type) / f"{cache_key}.json"
+        cache_file = self._get_cache_file(cache_type, identifier, params)
+        now = datetime.now()
         
         cache_data = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': now.isoformat(),
             'identifier': identifier,
             'params': params,
             'data': data
         }
-        
+        # Encode in the caller's thread: the writer only ever sees a snapshot,
+        # so later mutation of data cannot leak into (or break) the disk write
         try:
-            with open(cache_file, 'w') as f:
-                json.dump(cache_data, f, indent=2)
-            logger.debug(f"Cached data for {identifier}")
+            payload = _dumps_cache_entry(cache_data)
         except Exception as e:
             logger.error(f"Error caching data for {identifier}: {e}")
+            return
+        self._remember(cache_file, now, payload)
+        
+        if self._closed or not _writer.submit(cache_file, payload, identifier):
+            _write_cache_file(cache_file, payload, identifier)
+    
+    def flush(self) -> None:
+        """Block until all queued cache writes have reached disk"""
+        _writer.flush()
+    
+    def close(self) -> None:
+        """Flush pending writes; later set() calls on this manager write synchronously"""
+        self._closed = True
+        self.flush()
+    
+    def invalidate(self, cache_type: str, identifier: str, params: Dict[str, Any] = None) -> None:
+        """Drop a cached entry from both the memory and disk layers"""
+        cache_file = self._get_cache_file(cache_type, identifier, params)
+        with self._mem_lock:
+            self._mem.pop(cache_file, None)
+        self.flush()  # A queued write must not resurrect the entry
+        try:
+            cache_file.unlink()
+        except FileNotFoundError:
+            pass
+    
+    def _remember(self, cache_file: Path, cached_time: datetime, payload: bytes) -> None:
+        """Store an encoded entry in the memory layer, evicting the least recently used"""
+        with self._mem_lock:
+            self._mem[cache_file] = (cached_time, payload)
+            self._mem.move_to_end(cache_file)
+            while len(self._mem) > self.memory_size:
+                self._mem.popitem(last=False)
+    
+    def _get_cache_file(self, cache_type: str, identifier: str, params: Dict[str, Any] = None) -> Path:
+        """Get the cache file path for an identifier and its parameters"""
+        cache_key = self._generate_cache_key(identifier, params)
+        return self._get_cache_path(cache_type) / f"{cache_key}.json"
     
     def _get_cache_path(self, cache_type: str) -> Path:
         """Get the appropriate cache directory for the cache type"""
-        paths = {
-            'api': self.api_cache_dir,
-            'processed': self.processed_cache_dir,
-            'summary': self.summary_cache_dir
-        }
-        return paths.get(cache_type, self.cache_dir)
+        return self._cache_paths.get(cache_type, self.cache_dir)
+    
+    @staticmethod
+    def _scan_cache_files(cache_dir: Path) -> Iterator[os.DirEntry]:
+        """Yield directory entries for cache files without an extra stat per file"""
+        with os.scandir(cache_dir) as it:
+            for entry in it:
+                if entry.name.endswith('.json') and entry.is_file():
+                    yield entry
     
     def clear_expired(self) -> int:
         """Clear all expired cache files"""
         cleared = 0
+        # Files are written once per set(), so mtime tracks the cache timestamp
+        # and old files can go without being decoded
+        cutoff = time.time() - self.default_ttl.total_seconds()
         for cache_dir in [self.api_cache_dir, self.processed_cache_dir, self.summary_cache_dir]:
-            for cache_file in cache_dir.glob("*.json"):
+            for entry in self._scan_cache_files(cache_dir):
                 try:
-                    with open(cache_file, 'r') as f:
-                        cache_data = json.load(f)
-                    
-                    cached_time = datetime.fromisoformat(cache_data['timestamp'])
-                    if datetime.now() - cached_time > self.default_ttl:
-                        cache_file.unlink()
-                        cleared += 1
+                    if entry.stat().st_mtime >= cutoff:
+                        cache_data = _loads_cache_entry(Path(entry.path).read_bytes())
+                        cached_time = datetime.fromisoformat(cache_data['timestamp'])
+                        if datetime.now() - cached_time <= self.default_ttl:
+                            continue
+                except FileNotFoundError:
+                    continue
                 except Exception:
                     # If we can't read the file, delete it
-                    cache_file.unlink()
+                    pass
+                try:
+                    os.unlink(entry.path)
                     cleared += 1
+                except FileNotFoundError:
+                    continue
         
         logger.info(f"Cleared {cleared} expired cache files")
         return cleared
@@ -128,14 +308,18 @@ class CacheManager:
             ('processed', self.processed_cache_dir),
             ('summary', self.summary_cache_dir)
         ]:
-            files = list(cache_dir.glob("*.json"))
-            size = sum(f.stat().st_size for f in files) / (1024 * 1024)  # MB
+            files = 0
+            size = 0
+            for entry in self._scan_cache_files(cache_dir):
+                files += 1
+                size += entry.stat().st_size
+            size /= (1024 * 1024)  # MB
             
             stats['by_type'][cache_type] = {
-                'files': len(files),
+                'files': files,
                 'size_mb': round(size, 2)
             }
-            stats['total_files'] += len(files)
+            stats['total_files'] += files
             stats['total_size_mb'] += size
         
         stats['total_size_mb'] = round(stats['total_size_mb'], 2)
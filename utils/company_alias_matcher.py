@@ -4,17 +4,54 @@ Provides intelligent vendor/manufacturer/distributor matching with extensive ali
 """
 
 import re
+import sys
 import logging
-from typing import Dict, List, Set, Tuple, Optional, Any
-from collections import defaultdict, Counter
+import threading
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterator, List, Set, Tuple, Optional, Any
+from collections import defaultdict, Counter, OrderedDict
 from dataclasses import dataclass
 
+# Optional single-pass multi-alias scanning
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Optional fast JSON encoding for debug reports
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# The only characters re.IGNORECASE equates with ASCII letters where str.lower() does
+# not map 1:1 (or at all). Without them, lower() keeps offsets and agrees with IGNORECASE.
+_CASEFOLD_SPECIAL = ('\u0130', '\u0131', '\u017f', '\u212a')
+
+# Joins texts for batch scanning; contains no term characters and is not a word character
+_BATCH_SEPARATOR = '\x00'
+
+# Beyond this many target companies one automaton pass beats a pattern pass per target
+_SUBSET_SCAN_MAX_TARGETS = 2
+
+# Business terms that make a vendor mention more specific
+_SPECIFIC_TERMS = ('pricing', 'license', 'cost', 'acquisition', 'merger', 'partnership')
+
+# Slotted result records where dataclasses support it (Python 3.10+)
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(frozen=True, **_DATACLASS_OPTIONS)
 class AliasMatchResult:
-    """Result of alias matching operation"""
+    """Result of alias matching operation.
+    
+    Results are cached and the same instance is returned for repeated texts, so
+    callers must treat the sets, dicts and lists inside as read-only.
+    """
     matched_companies: Set[str]
     alias_hits: Dict[str, List[str]]  # company -> list of aliases that matched
     total_matches: int
@@ -25,21 +62,69 @@ class AliasMatchResult:
 class CompanyAliasMatcher:
     """Advanced company alias matching system for ULTRATHINK"""
     
-    def __init__(self, debug: bool = False):
+    # Read-only lookup tables, built once per process and shared by every instance
+    _SHARED_TABLE_ATTRS = (
+        'company_mappings', 'acquisition_mappings', 'reverse_mappings', 'sorted_aliases',
+        '_n_companies', '_total_aliases', 'automaton',
+    )
+    _shared_tables: Optional[Tuple[Any, ...]] = None
+    
+    # Regex fallback prefilter tables, compiled on first use
+    _shared_regex_tables: Optional[Tuple[Any, ...]] = None
+    
+    # Per-company pattern caches, filled as each company is first scanned
+    _shared_company_patterns: Optional[Tuple[Dict[str, Any], ...]] = None
+    
+    # Serializes the first build so concurrent cold starts compile the tables once
+    _shared_tables_lock = threading.Lock()
+    
+    __slots__ = _SHARED_TABLE_ATTRS + (
+        'debug', '_normalize_cache', 'normalize_cache_size', '_result_cache', '_result_cache_lock',
+        'result_cache_size', 'match_stats', 'alias_hit_counter',
+    )
+    
+    def __init__(self, debug: bool = False, result_cache_size: int = 2048):
         self.debug = debug
-        self.company_mappings = self._get_expanded_company_mappings()
-        self.acquisition_mappings = self._get_acquisition_mappings()
-        self.reverse_mappings = self._build_reverse_mappings()
-        self.compiled_patterns = self._compile_regex_patterns()
+        
+        cls = type(self)
+        tables = cls.__dict__.get('_shared_tables')
+        if tables is None:
+            with cls._shared_tables_lock:
+                tables = cls.__dict__.get('_shared_tables')
+                if tables is None:
+                    tables = self._build_shared_tables()
+                    cls._shared_tables = tables
+        for name, value in zip(self._SHARED_TABLE_ATTRS, tables):
+            setattr(self, name, value)
+        
+        # Memoized normalize_company_name() lookups keyed by the raw input
+        self._normalize_cache: Dict[str, Optional[str]] = {}
+        self.normalize_cache_size = 4096
+        
+        # Recent find_companies_in_text results keyed by text, least recently used first
+        self._result_cache: OrderedDict = OrderedDict()
+        self._result_cache_lock = threading.Lock()  # Guards the reorder/evict steps
+        self.result_cache_size = result_cache_size
         
         # Debug tracking
         self.match_stats = defaultdict(int)
-        self.alias_hit_counter = Counter()
+        self.alias_hit_counter = Counter()  # (company, lowercased alias) -> hits
         
-        logger.info(f"✅ Company Alias Matcher initialized with {len(self.company_mappings)} companies")
-        logger.info(f"📊 Total aliases: {sum(len(aliases) for aliases in self.company_mappings.values())}")
+        logger.info(f"✅ Company Alias Matcher initialized with {self._n_companies} companies")
+        logger.info(f"📊 Total aliases: {self._total_aliases}")
         logger.info(f"🔗 Acquisition mappings: {len(self.acquisition_mappings)} tracked")
     
+    def _build_shared_tables(self) -> Tuple[Any, ...]:
+        """Build the mappings, patterns and automaton in _SHARED_TABLE_ATTRS order"""
+        self.company_mappings = self._get_expanded_company_mappings()
+        self.acquisition_mappings = self._get_acquisition_mappings()
+        self.reverse_mappings = self._build_reverse_mappings()
+        self.sorted_aliases = sorted(self.reverse_mappings)
+        self._n_companies = len(self.company_mappings)
+        self._total_aliases = sum(len(aliases) for aliases in self.company_mappings.values())
+        self.automaton = self._build_automaton()
+        return tuple(getattr(self, name) for name in self._SHARED_TABLE_ATTRS)
+    
     def _get_expanded_company_mappings(self) -> Dict[str, List[str]]:
         """Expanded company alias mapping covering enterprise IT ecosystem with 2024-2025 enhancements"""
         return {
@@ -236,62 +321,377 @@ class CompanyAliasMatcher:
                 
         return reverse
     
-    def _compile_regex_patterns(self) -> Dict[str, Any]:
-        """Compile regex patterns for efficient matching"""
-        patterns = {}
+    @property
+    def compiled_patterns(self) -> Dict[str, Any]:
+        """Per-company regex patterns, all compiled on first access"""
+        ignorecase_patterns, _, by_company = self._get_company_patterns()
+        if len(by_company) < self._n_companies:
+            with type(self)._shared_tables_lock:
+                if len(by_company) < self._n_companies:
+                    for company in self.company_mappings:
+                        by_company[company] = self._company_pattern(company, ignorecase_patterns)
+        return by_company
+    
+    def _get_regex_tables(self) -> Tuple[Any, ...]:
+        """Compile the regex fallback prefilter tables once per process, on first use.
         
-        for company, aliases in self.company_mappings.items():
-            # Create pattern that matches company name or any alias
-            all_terms = [company] + aliases
-            
-            # Escape special regex characters and create word boundary patterns
-            escaped_terms = [re.escape(term) for term in all_terms]
-            pattern_str = r'\b(?:' + '|'.join(escaped_terms) + r')\b'
-            
-            patterns[company] = re.compile(pattern_str, re.IGNORECASE)
+        With the automaton available they are only needed for texts it cannot
+        handle, so matchers used just for normalization never compile them.
+        """
+        cls = type(self)
+        tables = cls.__dict__.get('_shared_regex_tables')
+        if tables is None:
+            with cls._shared_tables_lock:
+                tables = cls.__dict__.get('_shared_regex_tables')
+                if tables is None:
+                    tables = self._compile_master_pattern() + (self._build_term_trigrams(),)
+                    cls._shared_regex_tables = tables
+        return tables
+    
+    def _get_company_patterns(self) -> Tuple[Dict[str, Any], ...]:
+        """Shared per-company pattern caches, each starting empty.
+        
+        Holds IGNORECASE patterns for the original text, case-sensitive patterns
+        over lowercased terms for texts that fold cleanly, and the complete
+        compiled_patterns mapping in company order.
+        """
+        cls = type(self)
+        caches = cls.__dict__.get('_shared_company_patterns')
+        if caches is None:
+            with cls._shared_tables_lock:
+                caches = cls.__dict__.get('_shared_company_patterns')
+                if caches is None:
+                    caches = cls._shared_company_patterns = ({}, {}, {})
+        return caches
+    
+    def _company_pattern(self, company: str, company_patterns: Dict[str, Any], lowered: bool = False) -> Any:
+        """Pattern for one company, compiled and stored on first use"""
+        pattern = company_patterns.get(company)
+        if pattern is None:
+            # Racing threads compile equal patterns; whichever lands is fine
+            pattern = self._compile_company_pattern(company, self.company_mappings[company], lowered)
+            company_patterns[company] = pattern
+        return pattern
+    
+    def _company_matches(self, company: str, text: str, text_lower: Optional[str]) -> List[str]:
+        """What the company's pattern finds in text, as findall would report it.
+        
+        Pass text_lower only for texts that fold cleanly: its offsets then line up
+        with text and matching it case-sensitively agrees with IGNORECASE.
+        """
+        ignorecase_patterns, lowered_patterns, _ = self._get_company_patterns()
+        if text_lower is None:
+            return self._company_pattern(company, ignorecase_patterns).findall(text)
+        pattern = self._company_pattern(company, lowered_patterns, lowered=True)
+        # Report matches with their original casing
+        return [text[match.start():match.end()] for match in pattern.finditer(text_lower)]
+    
+    @staticmethod
+    def _company_terms(company: str, aliases: List[str]) -> List[str]:
+        """Company name and aliases without duplicates, longest first so the fullest alias wins"""
+        return sorted(dict.fromkeys([company] + aliases), key=len, reverse=True)
+    
+    def _compile_company_pattern(self, company: str, aliases: List[str], lowered: bool = False) -> Any:
+        """Compile the regex matching a company name or any of its aliases.
+        
+        The lowered form matches lowercased text without IGNORECASE, so _sre
+        skips case folding on every character it compares.
+        """
+        terms = self._company_terms(company, aliases)
+        if lowered:
+            terms = dict.fromkeys(term.lower() for term in terms)
+        # Escape special regex characters and create word boundary patterns
+        escaped_terms = [re.escape(term) for term in terms]
+        pattern_str = r'\b(?:' + '|'.join(escaped_terms) + r')\b'
+        return re.compile(pattern_str, 0 if lowered else re.IGNORECASE)
+    
+    def _compile_master_pattern(self) -> Tuple[Any, Dict[str, Tuple[int, ...]]]:
+        """Compile one lookahead alternation over every term, longest first.
+        
+        The lookahead reports the longest term at each word start without consuming
+        text, so overlapping mentions of different companies are all seen. Since a
+        shorter term can only be shadowed by a longer one it prefixes, each term maps
+        to the companies owning any of its prefixes; only those patterns need a findall.
+        """
+        owners = defaultdict(set)
+        for company_index, (company, aliases) in enumerate(self.company_mappings.items()):
+            for term in self._company_terms(company, aliases):
+                owners[term.lower()].add(company_index)
+        
+        terms = sorted(owners, key=len, reverse=True)
+        term_candidates = {}
+        for term in terms:
+            candidates = set()
+            for prefix, prefix_owners in owners.items():
+                if term.startswith(prefix):
+                    candidates |= prefix_owners
+            term_candidates[term] = tuple(sorted(candidates))
+        
+        alternation = '|'.join(re.escape(term) for term in terms)
+        master_pattern = re.compile(r'(?=\b(' + alternation + r')\b)', re.IGNORECASE)
+        return master_pattern, term_candidates
+    
+    def _build_term_trigrams(self) -> Tuple[Tuple[frozenset, int], ...]:
+        """Lowercased trigrams of every term, paired with the owning company index.
+        
+        Terms shorter than three characters get an empty set and are always checked.
+        """
+        term_trigrams = []
+        for company_index, (company, aliases) in enumerate(self.company_mappings.items()):
+            for term in self._company_terms(company, aliases):
+                term_lower = term.lower()
+                trigrams = frozenset(term_lower[i:i + 3] for i in range(len(term_lower) - 2))
+                term_trigrams.append((trigrams, company_index))
+        return tuple(term_trigrams)
+    
+    def _build_automaton(self):
+        """Build one Aho-Corasick automaton over every company name and alias (None if unavailable)"""
+        if not AHOCORASICK_AVAILABLE:
+            return None
+        
+        owners = defaultdict(list)
+        for company_index, (company, aliases) in enumerate(self.company_mappings.items()):
+            for term_index, term in enumerate(self._company_terms(company, aliases)):
+                owners[term.lower()].append((company_index, term_index, len(term)))
+        
+        automaton = ahocorasick.Automaton()
+        for term, term_owners in owners.items():
+            automaton.add_word(term, tuple(term_owners))
+        automaton.make_automaton()
+        return automaton
+    
+    @staticmethod
+    def _is_word_char(ch: str) -> bool:
+        """Mirror the regex \\w class for a single character"""
+        return ch.isalnum() or ch == '_'
+    
+    def _iter_automaton_hits(self, text: str, text_lower: str) -> Iterator[Tuple[int, int, int, int]]:
+        """Yield (start, stop, company_index, term_index) for every word-bounded term occurrence"""
+        is_word = self._is_word_char
+        last = len(text) - 1
+        
+        for end, term_owners in self.automaton.iter(text_lower):
+            for company_index, term_index, length in term_owners:
+                start = end - length + 1
+                # Word boundary on both sides, as \b would require
+                if start > 0 and is_word(text[start - 1]) == is_word(text[start]):
+                    continue
+                if end < last and is_word(text[end]) == is_word(text[end + 1]):
+                    continue
+                yield start, end + 1, company_index, term_index
+    
+    def _resolve_automaton_hits(self, text: str,
+                                candidates: Dict[int, List[Tuple[int, int, int]]]) -> List[Tuple[str, List[str]]]:
+        """Reduce (start, term_index, stop) candidates per company to what findall would return"""
+        companies = list(self.company_mappings)
+        results = []
+        for company_index in sorted(candidates):
+            # Leftmost match wins, ties go to the earliest alternative, no overlaps
+            matches = []
+            resume = 0
+            for start, _, stop in sorted(candidates[company_index]):
+                if start >= resume:
+                    matches.append(text[start:stop])
+                    resume = stop
+            results.append((companies[company_index], matches))
+        return results
+    
+    def _scan_automaton(self, text: str, text_lower: str) -> List[Tuple[str, List[str]]]:
+        """Single pass over text reproducing the per-company \\b(?:...)\\b findall results"""
+        candidates = defaultdict(list)
+        for start, stop, company_index, term_index in self._iter_automaton_hits(text, text_lower):
+            candidates[company_index].append((start, term_index, stop))
+        return self._resolve_automaton_hits(text, candidates)
+    
+    def _scan_regex(self, text: str, text_lower: Optional[str] = None) -> List[Tuple[str, List[str]]]:
+        """Prefilter the companies that can match, then findall only for those.
+        
+        text_lower is passed through to _company_matches and has the same contract.
+        """
+        master_pattern, term_candidates, term_trigrams = self._get_regex_tables()
+        if text_lower is not None:
+            # A term can only match if every one of its trigrams occurs in the lowered
+            # text; one set build and a subset test per term beat the master pattern
+            text_trigrams = {text_lower[i:i + 3] for i in range(len(text_lower) - 2)}
+            flagged = {company_index for trigrams, company_index in term_trigrams
+                       if trigrams <= text_trigrams}
+        else:
+            flagged = set()
+            for term in {term.lower() for term in master_pattern.findall(text)}:
+                candidates = term_candidates.get(term)
+                if candidates is None:
+                    # IGNORECASE matched a character str.lower() does not fold; check everything
+                    flagged = range(self._n_companies)
+                    break
+                flagged.update(candidates)
         
-        return patterns
+        results = []
+        companies = list(self.company_mappings) if flagged else ()
+        for company_index in sorted(flagged):
+            company = companies[company_index]
+            matches = self._company_matches(company, text, text_lower)
+            if matches:
+                results.append((company, matches))
+        return results
     
     def find_companies_in_text(self, text: str, min_confidence: float = 0.5) -> AliasMatchResult:
         """Find all companies mentioned in text using alias matching with enhanced M&A intelligence"""
         if not text:
             return AliasMatchResult(set(), {}, 0, 0.0, {})
         
+        cached = self._cached_result(text)
+        if cached is not None:
+            return cached
+        
+        # Lowercase once: the automaton scans it and the specific-terms check reuses it
         text_lower = text.lower()
-        matched_companies = set()
-        alias_hits = defaultdict(list)
+        company_matches = self._scan(text, text_lower)
+        
+        result = self._build_match_result(text, text_lower, company_matches)
+        self._remember_result(text, result)
+        return result
+    
+    def find_companies_fast(self, text: str) -> frozenset:
+        """Names of the companies mentioned in text, without building a full result.
+        
+        Matches find_companies_in_text(text).matched_companies but skips alias hit
+        bookkeeping, acquisition lookups and confidence scoring.
+        """
+        if not text:
+            return frozenset()
+        
+        cached = self._cached_result(text)
+        if cached is not None:
+            return frozenset(cached.matched_companies)
+        
+        company_matches = self._scan(text, text.lower())
+        if self.debug:
+            self._record_hits(dict(company_matches))
+        return frozenset(company for company, _ in company_matches)
+    
+    def _scan(self, text: str, text_lower: str) -> List[Tuple[str, List[str]]]:
+        """Per-company matches for text, from the automaton when it can be used"""
+        folds_cleanly = not any(ch in text for ch in _CASEFOLD_SPECIAL)
+        
+        # Offsets in the lowercased copy only line up with the original (and only
+        # agree with IGNORECASE) when the text folds cleanly
+        if self.automaton is not None and folds_cleanly:
+            return self._scan_automaton(text, text_lower)
+        return self._scan_regex(text, text_lower if folds_cleanly else None)
+    
+    def find_companies_in_texts(self, texts: List[str], min_confidence: float = 0.5) -> List[AliasMatchResult]:
+        """Find companies in many texts at once, in input order.
+        
+        Texts the automaton can handle are joined and scanned in a single pass; the
+        rest go through find_companies_in_text. Results are identical either way.
+        """
+        results: List[Optional[AliasMatchResult]] = [None] * len(texts)
+        for i, text in enumerate(texts):
+            if text:
+                results[i] = self._cached_result(text)
+        
+        batch = []
+        if self.automaton is not None:
+            batch = [i for i, text in enumerate(texts)
+                     if text and results[i] is None and not any(ch in text for ch in _CASEFOLD_SPECIAL)]
+        
+        if batch:
+            # No term contains the separator, and as a non-word character it gives
+            # every text the same word boundaries it has on its own
+            joined = _BATCH_SEPARATOR.join(texts[i] for i in batch)
+            joined_lower = joined.lower()
+            offsets = []
+            position = 0
+            for i in batch:
+                offsets.append(position)
+                position += len(texts[i]) + len(_BATCH_SEPARATOR)
+            
+            candidates = [defaultdict(list) for _ in batch]
+            for start, stop, company_index, term_index in self._iter_automaton_hits(joined, joined_lower):
+                slot = bisect_right(offsets, start) - 1
+                base = offsets[slot]
+                candidates[slot][company_index].append((start - base, term_index, stop - base))
+            
+            for slot, i in enumerate(batch):
+                text = texts[i]
+                base = offsets[slot]
+                company_matches = self._resolve_automaton_hits(text, candidates[slot])
+                results[i] = self._build_match_result(
+                    text, joined_lower[base:base + len(text)], company_matches
+                )
+                self._remember_result(text, results[i])
+        
+        for i, text in enumerate(texts):
+            if results[i] is None:
+                results[i] = self.find_companies_in_text(text, min_confidence)
+        return results
+    
+    def _cached_result(self, text: str) -> Optional[AliasMatchResult]:
+        """Return a remembered result for text, counting its hits again when debugging"""
+        with self._result_cache_lock:
+            result = self._result_cache.get(text)
+            if result is not None:
+                self._result_cache.move_to_end(text)
+        if result is not None and self.debug:
+            self._record_hits(result.alias_hits)
+        return result
+    
+    def _remember_result(self, text: str, result: AliasMatchResult) -> None:
+        """Store a result, evicting the least recently used"""
+        if self.result_cache_size <= 0:
+            return
+        with self._result_cache_lock:
+            self._result_cache[text] = result
+            while len(self._result_cache) > self.result_cache_size:
+                self._result_cache.popitem(last=False)
+    
+    def _record_hits(self, alias_hits: Dict[str, List[str]]) -> None:
+        """Update the statistics reported by get_debug_stats()"""
+        for company, matches in alias_hits.items():
+            self.alias_hit_counter.update((company, match.lower()) for match in matches)
+            self.match_stats[company] += len(matches)
+    
+    def _build_match_result(self, text: str, text_lower: str,
+                            company_matches: List[Tuple[str, List[str]]]) -> AliasMatchResult:
+        """Turn per-company matches into an AliasMatchResult with confidence scoring"""
+        alias_hits = {}
         total_matches = 0
         relevant_acquisitions = {}
+        acquisition_mappings = self.acquisition_mappings
+        debug = self.debug
         
-        # Check each company pattern
-        for company, pattern in self.compiled_patterns.items():
-            matches = pattern.findall(text)
+        for company, matches in company_matches:
+            total_matches += len(matches)
+            alias_hits[company] = matches
             
-            if matches:
-                matched_companies.add(company)
-                total_matches += len(matches)
-                
-                # Track which specific aliases matched
-                for match in matches:
-                    alias_hits[company].append(match)
-                    self.alias_hit_counter[f"{company}:{match.lower()}"] += 1
-                    
-                    # Check if this alias represents an acquisition
-                    if match.lower() in self.acquisition_mappings:
-                        parent_company = self.acquisition_mappings[match.lower()]
-                        relevant_acquisitions[match.lower()] = parent_company
-                
+            # Lowercase each match once; the debug counters and the acquisition check share it
+            lowered = [match.lower() for match in matches]
+            if debug:
+                # Hit statistics are only reported by get_debug_stats()
+                self.alias_hit_counter.update((company, alias) for alias in lowered)
                 self.match_stats[company] += len(matches)
+            
+            # Check if any distinct matched alias represents an acquisition, in first-seen order
+            for alias in dict.fromkeys(lowered):
+                parent_company = acquisition_mappings.get(alias)
+                if parent_company is not None:
+                    relevant_acquisitions[alias] = parent_company
+        
+        matched_companies = set(alias_hits)
         
         # Enhanced confidence scoring with multiple factors
-        word_count = len(text.split())
         char_count = len(text)
         
-        # Factor 1: Match density (how many vendor mentions per word)
-        match_density = total_matches / max(word_count, 1)
+        # Factor 1: Match density (how many vendor mentions per word); zero matches
+        # means zero density, so only split the text when there is something to divide
+        if total_matches:
+            word_count = len(text.split())
+            match_density = total_matches / max(word_count, 1)
+        else:
+            match_density = 0.0
         
         # Factor 2: Company diversity (how many different companies mentioned)
-        diversity_score = len(matched_companies) / max(len(self.company_mappings), 1)
+        diversity_score = len(matched_companies) / max(self._n_companies, 1)
         
         # Factor 3: Text richness (longer text with multiple mentions is more confident)
         text_richness = min(1.0, char_count / 500)  # Normalize to 500 chars
@@ -300,8 +700,7 @@ class CompanyAliasMatcher:
         acquisition_boost = 0.1 if relevant_acquisitions else 0.0
         
         # Factor 5: Specific product/service mentions boost confidence
-        specific_terms = ['pricing', 'license', 'cost', 'acquisition', 'merger', 'partnership']
-        specificity_boost = 0.1 if any(term in text_lower for term in specific_terms) else 0.0
+        specificity_boost = 0.1 if any(term in text_lower for term in _SPECIFIC_TERMS) else 0.0
         
         # Combined confidence score with weighted factors
         base_confidence = min(1.0, (
@@ -316,15 +715,15 @@ class CompanyAliasMatcher:
         # Scale from 0.2-1.0 range to 0.4-1.0 range for better practical use
         confidence_score = max(0.2, min(1.0, base_confidence * 1.5))
         
-        if self.debug and matched_companies:
+        if debug and matched_companies:
             logger.debug(f"🎯 Found companies in text: {matched_companies}")
-            logger.debug(f"📊 Alias hits: {dict(alias_hits)}")
+            logger.debug(f"📊 Alias hits: {alias_hits}")
             logger.debug(f"🔗 Acquisition mappings: {relevant_acquisitions}")
             logger.debug(f"📈 Confidence components: density={match_density:.2f}, diversity={diversity_score:.2f}, richness={text_richness:.2f}")
         
         return AliasMatchResult(
             matched_companies=matched_companies,
-            alias_hits=dict(alias_hits),
+            alias_hits=alias_hits,
             total_matches=total_matches,
             confidence_score=confidence_score,
             acquisition_mappings=relevant_acquisitions
@@ -332,11 +731,27 @@ class CompanyAliasMatcher:
     
     def normalize_company_name(self, company_input: str) -> Optional[str]:
         """Normalize a company name or alias to the standard form"""
-        normalized = self.reverse_mappings.get(company_input.lower())
+        try:
+            normalized = self._normalize_cache[company_input]
+        except KeyError:
+            if len(self._normalize_cache) >= self.normalize_cache_size:
+                self._normalize_cache.clear()
+            normalized = self.reverse_mappings.get(company_input.lower())
+            self._normalize_cache[company_input] = normalized
         if self.debug and normalized:
             logger.debug(f"🔄 Normalized '{company_input}' → '{normalized}'")
         return normalized
     
+    def normalize_batch(self, names: List[str]) -> List[Optional[str]]:
+        """Normalize many names in one call, as normalize_company_name would each"""
+        lookup = self.reverse_mappings.get
+        normalized = [lookup(name.lower()) for name in names]
+        if self.debug:
+            for name, result in zip(names, normalized):
+                if result:
+                    logger.debug(f"🔄 Normalized '{name}' → '{result}'")
+        return normalized
+    
     def get_all_aliases_for_company(self, company: str) -> List[str]:
         """Get all aliases for a given company"""
         normalized = self.normalize_company_name(company)
@@ -344,6 +759,18 @@ class CompanyAliasMatcher:
             return self.company_mappings.get(normalized, [])
         return []
     
+    def find_aliases_by_prefix(self, prefix: str) -> Dict[str, str]:
+        """Map every known name or alias starting with prefix to its company"""
+        prefix = prefix.lower()
+        aliases = self.sorted_aliases
+        matches = {}
+        for i in range(bisect_left(aliases, prefix), len(aliases)):
+            alias = aliases[i]
+            if not alias.startswith(prefix):
+                break
+            matches[alias] = self.reverse_mappings[alias]
+        return matches
+    
     def expand_keyword_list(self, keywords: List[str]) -> List[str]:
         """Expand a keyword list to include all relevant aliases"""
         expanded = set(keywords)  # Start with original keywords
@@ -366,20 +793,35 @@ class CompanyAliasMatcher:
         
         return expanded_list
     
-    def get_company_relevance_score(self, text: str, target_companies: List[str]) -> Dict[str, float]:
-        """Calculate relevance scores for specific companies in text"""
-        result = self.find_companies_in_text(text)
+    def get_company_relevance_score(self, text: str, target_companies: List[str], *,
+                                    result: Optional[AliasMatchResult] = None) -> Dict[str, float]:
+        """Calculate relevance scores for specific companies in text.
+        
+        Pass the AliasMatchResult already computed for text to skip rescanning it.
+        """
+        normalized_targets = {company: self.normalize_company_name(company) for company in target_companies}
+        if result is None:
+            result = self._cached_result(text) if text else None
+        targets = list(dict.fromkeys(normalized for normalized in normalized_targets.values()
+                                     if normalized in self.company_mappings))
+        if result is None and self.automaton is not None and len(targets) > _SUBSET_SCAN_MAX_TARGETS:
+            result = self.find_companies_in_text(text)
+        if result is not None:
+            alias_hits = result.alias_hits
+        else:
+            # Only the targets' own patterns matter, so skip scanning for everyone else
+            alias_hits = self._scan_subset(text, targets)
         scores = {}
         
         for company in target_companies:
-            normalized = self.normalize_company_name(company)
-            if normalized and normalized in result.matched_companies:
+            normalized = normalized_targets[company]
+            if normalized and normalized in alias_hits:
                 # Base score from number of mentions
-                mention_count = len(result.alias_hits.get(normalized, []))
+                mention_count = len(alias_hits[normalized])
                 base_score = min(1.0, mention_count / 3.0)  # Cap at 3 mentions = 1.0
                 
                 # Boost for exact company name matches vs aliases
-                exact_matches = sum(1 for hit in result.alias_hits.get(normalized, []) 
+                exact_matches = sum(1 for hit in alias_hits[normalized]
                                    if hit.lower() == normalized.lower())
                 exact_boost = exact_matches * 0.2
                 
@@ -389,6 +831,22 @@ class CompanyAliasMatcher:
         
         return scores
     
+    def _scan_subset(self, text: str, companies: List[str]) -> Dict[str, List[str]]:
+        """Matches for just the given companies, as find_companies_in_text would report them"""
+        if not text:
+            return {}
+        
+        text_lower = None if any(ch in text for ch in _CASEFOLD_SPECIAL) else text.lower()
+        alias_hits = {}
+        for company in companies:
+            matches = self._company_matches(company, text, text_lower)
+            if matches:
+                alias_hits[company] = matches
+        
+        if self.debug:
+            self._record_hits(alias_hits)
+        return alias_hits
+    
     def get_acquisition_intelligence(self, text: str) -> Dict[str, Dict[str, str]]:
         """Get acquisition intelligence for companies mentioned in text"""
         result = self.find_companies_in_text(text)
@@ -404,8 +862,8 @@ class CompanyAliasMatcher:
             acquisition_intel['direct_acquisitions'][acquired_company] = parent_company
             
             # Check if parent company is also acquired (acquisition chain)
-            if parent_company in self.acquisition_mappings:
-                ultimate_parent = self.acquisition_mappings[parent_company]
+            ultimate_parent = self.acquisition_mappings.get(parent_company)
+            if ultimate_parent is not None:
                 acquisition_intel['acquisition_chains'][acquired_company] = {
                     'immediate_parent': parent_company,
                     'ultimate_parent': ultimate_parent
@@ -418,10 +876,11 @@ class CompanyAliasMatcher:
     def get_debug_stats(self) -> Dict[str, any]:
         """Get debugging statistics"""
         return {
-            'total_companies': len(self.company_mappings),
-            'total_aliases': sum(len(aliases) for aliases in self.company_mappings.values()),
+            'total_companies': self._n_companies,
+            'total_aliases': self._total_aliases,
             'match_stats': dict(self.match_stats),
-            'top_aliases': self.alias_hit_counter.most_common(20),
+            'top_aliases': [(f"{company}:{alias}", count)
+                            for (company, alias), count in self.alias_hit_counter.most_common(20)],
             'companies_with_most_matches': sorted(self.match_stats.items(), 
                                                  key=lambda x: x[1], reverse=True)[:10]
         }
@@ -441,20 +900,27 @@ class CompanyAliasMatcher:
             }
         }
         
-        with open(filepath, 'w') as f:
-            json.dump(debug_data, f, indent=2)
+        if ORJSON_AVAILABLE:
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(debug_data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filepath, 'w') as f:
+                json.dump(debug_data, f, indent=2)
         
         logger.info(f"📄 Debug report saved to: {filepath}")
 
 
 # Global instance for easy access
 _global_matcher = None
+_global_matcher_lock = threading.Lock()
 
 def get_company_matcher(debug: bool = False) -> CompanyAliasMatcher:
     """Get global company matcher instance"""
     global _global_matcher
     if _global_matcher is None:
-        _global_matcher = CompanyAliasMatcher(debug=debug)
+        with _global_matcher_lock:
+            if _global_matcher is None:
+                _global_matcher = CompanyAliasMatcher(debug=debug)
     return _global_matcher
 
 
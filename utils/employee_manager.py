@@ -5,14 +5,21 @@ Handles weighted keyword consolidation and role-specific intelligence
 
 import csv
 import logging
-from typing import Dict, List, Set, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from pathlib import Path
-from dataclasses import dataclass
-from collections import defaultdict
+from dataclasses import dataclass, field
+from collections import defaultdict, Counter
 
 from .company_alias_matcher import get_company_matcher
 from config.utils import is_valid_email
 
+# Optional fast JSON encoding for debug reports
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -29,12 +36,13 @@ class Employee:
     active: bool
     combined_keywords: List[str]  # Weighted & deduplicated
     role_weight: float = 1.0
+    weight_map: Dict[str, float] = field(default_factory=dict)  # Consolidation weight per combined keyword
 
 
 @dataclass
 class ConsolidatedKeywords:
     """Result of keyword consolidation across all employees"""
-    all_keywords: Set[str]
+    all_keywords: Dict[str, None]  # Ordered set: keywords in first-seen order
     weighted_keywords: Dict[str, float]
     role_distribution: Dict[str, List[str]]
     expansion_stats: Dict[str, int]
@@ -84,8 +92,17 @@ class EmployeeManager:
             }
         }
         
+        # Alias expansion per keyword; the same vendors recur across most employees
+        self._expansion_cache: Dict[str, Tuple[str, ...]] = {}
+        
         self.employees = []
         self.consolidated_keywords = None
+        
+        # Lookups over the loaded employees, built once loading finishes
+        self._by_email: Dict[str, Employee] = {}
+        self._by_role: Dict[str, List[Employee]] = {}
+        self._active_employees: List[Employee] = []
+        
         self._load_employees()
     
     def _load_employees(self) -> None:
@@ -96,17 +113,38 @@ class EmployeeManager:
                 return
             
             with open(self.csv_path, 'r') as f:
-                reader = csv.DictReader(f)
+                reader = csv.reader(f)
+                fieldnames = next(reader, None)
                 
                 # Validate CSV schema
                 required_fields = ['name', 'email', 'role', 'vendors', 'manufacturers', 'distributors', 'topics', 'active']
-                if not all(field in reader.fieldnames for field in required_fields):
-                    missing = [f for f in required_fields if f not in reader.fieldnames]
+                field_set = set(fieldnames or ())
+                missing = [f for f in required_fields if f not in field_set]
+                if missing:
                     logger.error(f"❌ Missing CSV fields: {missing}")
                     return
                 
-                for row_num, row in enumerate(reader, 1):
+                # Column positions; a repeated header keeps its last column, as DictReader did
+                columns = {field: i for i, field in enumerate(fieldnames)}
+                active_idx = columns['active']
+                name_idx = columns['name']
+                
+                row_num = 0
+                for values in reader:
+                    if not values:
+                        continue  # Blank lines are not rows
+                    row_num += 1
                     try:
+                        # Check the active flag before building anything for the row;
+                        # missing trailing fields read as None, as with DictReader
+                        active = values[active_idx] if active_idx < len(values) else None
+                        if active.lower() != 'true':
+                            if self.debug:
+                                name = values[name_idx] if name_idx < len(values) else None
+                                logger.debug(f"Skipping inactive employee: {name}")
+                            continue
+                        
+                        row = {field: values[i] if i < len(values) else None for field, i in columns.items()}
                         employee = self._process_employee_row(row, row_num)
                         if employee:
                             self.employees.append(employee)
@@ -115,6 +153,8 @@ class EmployeeManager:
             
             logger.info(f"✅ Loaded {len(self.employees)} active employees")
             
+            self._build_indexes()
+            
             # Consolidate keywords across all employees
             self.consolidated_keywords = self._consolidate_all_keywords()
             
@@ -142,7 +182,7 @@ class EmployeeManager:
         topics = self._parse_keyword_field(row.get('topics', ''))
         
         # Generate combined keywords with weighting
-        combined_keywords = self._generate_weighted_keywords(
+        combined_keywords, weight_map = self._generate_weighted_keywords(
             vendors, manufacturers, distributors, topics
         )
         
@@ -156,7 +196,8 @@ class EmployeeManager:
             distributors=distributors,
             topics=topics,
             active=True,
-            combined_keywords=combined_keywords
+            combined_keywords=combined_keywords,
+            weight_map=weight_map
         )
         
         if self.debug:
@@ -174,20 +215,18 @@ class EmployeeManager:
         clean_value = field_value.strip().strip('"\'')
         keywords = [kw.strip().lower() for kw in clean_value.split(',') if kw.strip()]
         
-        # Normalize company names using alias matcher
-        normalized_keywords = []
-        for keyword in keywords:
-            normalized = self.company_matcher.normalize_company_name(keyword)
-            if normalized:
-                normalized_keywords.append(normalized)
-            else:
-                normalized_keywords.append(keyword)
-        
-        return normalized_keywords
+        # Normalize company names using alias matcher, keeping non-company keywords as-is
+        normalized = self.company_matcher.normalize_batch(keywords)
+        return [company or keyword for company, keyword in zip(normalized, keywords)]
     
     def _generate_weighted_keywords(self, vendors: List[str], manufacturers: List[str], 
-                                   distributors: List[str], topics: List[str]) -> List[str]:
-        """Generate weighted and expanded keyword list"""
+                                   distributors: List[str], topics: List[str]) -> Tuple[List[str], Dict[str, float]]:
+        """Generate weighted and expanded keyword list.
+        
+        Also returns the weight each keyword contributes to consolidation: that of
+        the highest-priority category listing it directly, or 0.5 for keywords only
+        reached through alias expansion.
+        """
         keyword_categories = {
             'topics': topics,
             'vendors': vendors, 
@@ -197,54 +236,73 @@ class EmployeeManager:
         
         # Build weighted keyword set
         weighted_keywords = {}
+        category_weights = {}
         
         for category, keywords in keyword_categories.items():
             weight = self.keyword_weights.get(category, 0.5)
             
-            # Expand keywords with company aliases
-            expanded_keywords = self.company_matcher.expand_keyword_list(keywords)
+            # Categories come in priority order, so the first one listing a keyword wins
+            for keyword in keywords:
+                category_weights.setdefault(keyword, weight)
             
-            for keyword in expanded_keywords:
-                if keyword in weighted_keywords:
-                    # Keep highest weight if keyword appears in multiple categories
-                    weighted_keywords[keyword] = max(weighted_keywords[keyword], weight)
-                else:
-                    weighted_keywords[keyword] = weight
+            # Expand keywords with company aliases
+            for original in keywords:
+                for keyword in self._expand_keyword(original):
+                    if keyword in weighted_keywords:
+                        # Keep highest weight if keyword appears in multiple categories
+                        weighted_keywords[keyword] = max(weighted_keywords[keyword], weight)
+                    else:
+                        weighted_keywords[keyword] = weight
         
-        # Sort by weight (descending) then alphabetically
-        sorted_keywords = sorted(weighted_keywords.items(), 
-                               key=lambda x: (-x[1], x[0]))
+        # Sort by weight (descending) then alphabetically: sort names first, then a stable
+        # sort on weight alone, so both passes compare plain strings and floats
+        combined_keywords = sorted(weighted_keywords)
+        combined_keywords.sort(key=weighted_keywords.__getitem__, reverse=True)
         
-        return [keyword for keyword, weight in sorted_keywords]
+        weight_map = {keyword: category_weights.get(keyword, 0.5) for keyword in combined_keywords}
+        return combined_keywords, weight_map
+    
+    def _expand_keyword(self, keyword: str) -> Tuple[str, ...]:
+        """Keyword plus all its company aliases, expanded once per distinct keyword"""
+        expanded = self._expansion_cache.get(keyword)
+        if expanded is None:
+            expanded = tuple(self.company_matcher.expand_keyword_list([keyword]))
+            self._expansion_cache[keyword] = expanded
+        return expanded
     
     def _consolidate_all_keywords(self) -> ConsolidatedKeywords:
         """Consolidate keywords across all employees for unified processing"""
-        all_keywords = set()
         weighted_keywords = defaultdict(float)
         role_distribution = defaultdict(list)
+        original_count = 0
+        roles = set()
         
-        # Collect keywords from all employees
+        # Collect keywords from all employees, tallying expansion statistics on the way
         for employee in self.employees:
+            original_count += (len(employee.vendors) + len(employee.manufacturers) +
+                               len(employee.distributors) + len(employee.topics))
+            roles.add(employee.role)
+            
+            weight_map = employee.weight_map
             for keyword in employee.combined_keywords:
-                all_keywords.add(keyword)
                 role_distribution[employee.role].append(keyword)
                 
                 # Track maximum weight across all employees
-                # Find weight for this keyword in this employee's categories
-                keyword_weight = self._get_keyword_weight_for_employee(keyword, employee)
-                weighted_keywords[keyword] = max(weighted_keywords[keyword], keyword_weight)
+                keyword_weight = weight_map[keyword]
+                if keyword_weight > weighted_keywords[keyword]:
+                    weighted_keywords[keyword] = keyword_weight
+        
+        # Every keyword seen has a weight entry, already in first-seen order
+        all_keywords = dict.fromkeys(weighted_keywords)
         
         # Calculate expansion statistics
-        original_count = sum(len(emp.vendors) + len(emp.manufacturers) + 
-                           len(emp.distributors) + len(emp.topics) 
-                           for emp in self.employees)
         expanded_count = len(all_keywords)
         
         expansion_stats = {
             'original_keywords': original_count,
             'expanded_keywords': expanded_count,
             'expansion_ratio': expanded_count / max(original_count, 1),
-            'unique_roles': len(set(emp.role for emp in self.employees))
+            'unique_roles': len(roles)
         }
         
         logger.info(f"🔗 Keyword consolidation complete:")
@@ -258,28 +316,24 @@ class EmployeeManager:
             expansion_stats=expansion_stats
         )
     
-    def _get_keyword_weight_for_employee(self, keyword: str, employee: Employee) -> float:
-        """Get the weight of a keyword for a specific employee"""
-        # Check which category this keyword belongs to for this employee
-        if keyword in employee.topics:
-            return self.keyword_weights['topics']
-        elif keyword in employee.vendors:
-            return self.keyword_weights['vendors']
-        elif keyword in employee.manufacturers:
-            return self.keyword_weights['manufacturers']
-        elif keyword in employee.distributors:
-            return self.keyword_weights['distributors']
-        else:
-            # Keyword was added through alias expansion
-            return 0.5  # Default weight for expanded aliases
+    def _build_indexes(self) -> None:
+        """Index employees by email (first one wins), by role, and by active flag"""
+        self._active_employees = [emp for emp in self.employees if emp.active]
+        self._by_email = {}
+        self._by_role = defaultdict(list)
+        for emp in self.employees:
+            self._by_email.setdefault(emp.email, emp)
+            if emp.active:
+                self._by_role[emp.role].append(emp)
+        self._by_role = dict(self._by_role)
     
     def get_active_employees(self) -> List[Employee]:
-        """Get all active employees"""
-        return [emp for emp in self.employees if emp.active]
+        """Get all active employees (a shared list; do not modify it)"""
+        return self._active_employees
     
     def get_employees_by_role(self, role: str) -> List[Employee]:
         """Get employees by role"""
-        return [emp for emp in self.employees if emp.role == role and emp.active]
+        return list(self._by_role.get(role, ()))
     
     def get_all_keywords(self) -> List[str]:
         """Get consolidated keyword list for all employees"""
@@ -299,23 +353,24 @@ class EmployeeManager:
     
     def get_employee_by_email(self, email: str) -> Optional[Employee]:
         """Get employee by email address"""
-        return next((emp for emp in self.employees if emp.email == email), None)
+        return self._by_email.get(email)
     
     def save_debug_report(self, filepath: str) -> None:
         """Save comprehensive debug report"""
         import json
         from datetime import datetime
         
+        # Roles in first-seen order, with active headcount per role
+        roles = list(dict.fromkeys(emp.role for emp in self.employees))
+        role_counts = Counter(emp.role for emp in self.employees if emp.active)
+        
         debug_data = {
             'timestamp': datetime.now().isoformat(),
             'employee_statistics': {
                 'total_employees': len(self.employees),
-                'active_employees': len(self.get_active_employees()),
-                'roles': list(set(emp.role for emp in self.employees)),
-                'role_distribution': {
-                    role: len(self.get_employees_by_role(role)) 
-                    for role in set(emp.role for emp in self.employees)
-                }
+                'active_employees': sum(role_counts.values()),
+                'roles': roles,
+                'role_distribution': {role: role_counts[role] for role in roles}
             },
             'keyword_statistics': self.consolidated_keywords.expansion_stats if self.consolidated_keywords else {},
             'keyword_weights': self.keyword_weights,
@@ -336,8 +391,12 @@ class EmployeeManager:
             for emp in self.employees[:3]  # First 3 employees as samples
         ]
         
-        with open(filepath, 'w') as f:
-            json.dump(debug_data, f, indent=2)
+        if ORJSON_AVAILABLE:
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(debug_data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filepath, 'w') as f:
+                json.dump(debug_data, f, indent=2)
         
         logger.info(f"📄 Employee debug report saved to: {filepath}")
 
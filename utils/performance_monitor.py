@@ -4,21 +4,34 @@ Enhanced with async capabilities and advanced metrics tracking
 Integrated from ultrathink-enhanced's superior monitoring patterns
 """
 
+import sys
 import time
 import psutil
+from array import array
 import logging
 import asyncio
 from datetime import datetime
-from typing import Dict, Any, Optional, Callable, List
+from typing import Dict, Any, Optional, Callable, Iterator
 from functools import wraps
+from itertools import chain
 from collections import defaultdict, deque
 from dataclasses import dataclass, asdict
 import json
 from pathlib import Path
 
+# Optional fast JSON encoding for saved metrics
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Slotted metric records where dataclasses support it (Python 3.10+)
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_OPTIONS)
 class SystemMetrics:
     """System resource metrics snapshot"""
     timestamp: float
@@ -28,8 +41,16 @@ class SystemMetrics:
     disk_usage_percent: float
     active_connections: int
 
-@dataclass
-class OperationMetrics:
+class _OperationClock:
+    """Slot for OperationMetrics' monotonic start time"""
+    
+    # Declared outside the dataclass fields so it is not an __init__ argument and
+    # never shows up in repr(), comparisons or dataclasses.asdict()
+    __slots__ = ('_start_counter',)
+
+
+@dataclass(**_DATACLASS_OPTIONS)
+class OperationMetrics(_OperationClock):
     """Individual operation performance metrics"""
     operation_name: str
     start_time: float
@@ -40,21 +61,94 @@ class OperationMetrics:
     data_size: int = 0
     api_calls: int = 0
     
+    def __post_init__(self):
+        # Monotonic start used for the duration; start_time/end_time stay wall-clock
+        self._start_counter = time.perf_counter()
+    
     def complete(self, success: bool = True, error_message: Optional[str] = None, data_size: int = 0, api_calls: int = 0):
         self.end_time = time.time()
-        self.duration = self.end_time - self.start_time
+        self.duration = time.perf_counter() - self._start_counter
         self.success = success
         self.error_message = error_message
         self.data_size = data_size
         self.api_calls = api_calls
 
 
+class _OperationSamples:
+    """Timer samples for one operation, stored column-wise in a ring buffer"""
+    
+    __slots__ = ('maxlen', 'timestamps', 'durations', 'memory_mb', 'cpu_percent', '_next',
+                 'count', 'total_time', 'min_time', 'max_time')
+    
+    def __init__(self, maxlen: int):
+        self.maxlen = maxlen
+        self.timestamps = array('d')  # Epoch seconds, formatted only on export
+        self.durations = array('d')
+        self.memory_mb = array('d')
+        self.cpu_percent = array('d')
+        self._next = 0  # Slot the next sample overwrites once the columns are full
+        
+        # Lifetime aggregates, kept up to date as samples arrive
+        self.count = 0
+        self.total_time = 0.0
+        self.min_time = float('inf')
+        self.max_time = 0.0
+    
+    def __len__(self) -> int:
+        return len(self.durations)
+    
+    def append(self, timestamp: float, duration: float, memory_mb: float, cpu_percent: float) -> None:
+        if len(self.durations) < self.maxlen:
+            self.timestamps.append(timestamp)
+            self.durations.append(duration)
+            self.memory_mb.append(memory_mb)
+            self.cpu_percent.append(cpu_percent)
+        else:
+            # Overwrite the oldest sample in place so a long-running monitor stays bounded
+            i = self._next
+            self.timestamps[i] = timestamp
+            self.durations[i] = duration
+            self.memory_mb[i] = memory_mb
+            self.cpu_percent[i] = cpu_percent
+            self._next = (i + 1) % self.maxlen
+        
+        self.count += 1
+        self.total_time += duration
+        if duration < self.min_time:
+            self.min_time = duration
+        if duration > self.max_time:
+            self.max_time = duration
+    
+    @property
+    def last_timestamp(self) -> float:
+        """Timestamp of the newest sample"""
+        return self.timestamps[self._next - 1]
+    
+    def iter_records(self) -> Iterator[Dict[str, Any]]:
+        """Yield the per-sample dicts used in saved metrics, oldest first"""
+        for i in chain(range(self._next, len(self.durations)), range(self._next)):
+            yield {'timestamp': datetime.fromtimestamp(self.timestamps[i]).isoformat(),
+                   'duration': self.durations[i], 'memory_mb': self.memory_mb[i],
+                   'cpu_percent': self.cpu_percent[i]}
+
+
+def _dumps_json(obj: Any, indent: bool = False) -> str:
+    """Encode JSON with orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+    return json.dumps(obj, indent=2 if indent else None)
+
+
 class PerformanceMonitor:
     """Enhanced performance monitor with async capabilities and comprehensive metrics"""
     
-    def __init__(self, name: str = "ULTRATHINK-AI-PRO", debug: bool = False):
+    def __init__(self, name: str = "ULTRATHINK-AI-PRO", debug: bool = False, max_samples: int = 10_000):
+        if max_samples < 1:
+            raise ValueError(f"max_samples must be at least 1, got {max_samples}")
+        
         # Existing functionality
-        self.metrics = defaultdict(list)
+        self._max_samples = max_samples  # Timer samples kept per operation
+        self.metrics: Dict[str, _OperationSamples] = defaultdict(lambda: _OperationSamples(self._max_samples))
         self.active_timers = {}
         self.api_call_counts = defaultdict(int)
         self.error_counts = defaultdict(int)
@@ -65,8 +159,14 @@ class PerformanceMonitor:
         self.start_time = time.time()
         
         # Enhanced metrics storage
-        self.operation_metrics: List[OperationMetrics] = []
+        self.operation_metrics: deque = deque(maxlen=2048)  # Recent operations only
+        self._op_stats: Dict[str, Dict[str, Any]] = {}  # Lifetime stats of successful operations
+        self._operations_started = 0
+        self._operations_succeeded = 0
+        self._operations_failed = 0
         self.system_metrics: deque = deque(maxlen=1000)  # Keep last 1000 measurements
+        self._system_memory_total = 0.0  # Running sums over system_metrics
+        self._system_cpu_total = 0.0
         
         # Performance tracking
         self.peak_memory_mb = 0
@@ -78,52 +178,79 @@ class PerformanceMonitor:
         self._monitoring_task = None
         self._monitoring_active = False
         
+        # One process handle for the monitor's lifetime; the first
+        # cpu_percent(None) call only primes psutil's counters
+        self._proc = psutil.Process()
+        self._proc.cpu_percent(None)
+        # cpu_percent(None) measures since the previous call on the same handle,
+        # so the sampling loop gets its own instead of resetting end_timer's
+        self._sampler_proc = psutil.Process()
+        self._sampler_proc.cpu_percent(None)
+        psutil.cpu_percent(None)
+        
+        # Slow-changing psutil readings: key -> (value, expiry)
+        self._cache: Dict[str, tuple] = {}
+        
         if debug:
             logger.info(f"📊 Enhanced Performance Monitor initialized for {self.name}")
         
     def start_timer(self, operation: str) -> None:
         """Start timing an operation"""
-        self.active_timers[operation] = time.time()
-        logger.debug(f"Started timer for: {operation}")
+        self.active_timers[operation] = time.perf_counter()
+        logger.debug("Started timer for: %s", operation)
     
     def end_timer(self, operation: str) -> float:
         """End timing and record the duration"""
         if operation not in self.active_timers:
-            logger.warning(f"No active timer for: {operation}")
+            logger.warning("No active timer for: %s", operation)
             return 0.0
         
         start_time = self.active_timers.pop(operation)
-        duration = time.time() - start_time
-        
-        self.metrics[operation].append({
-            'timestamp': datetime.now().isoformat(),
-            'duration': duration,
-            'memory_mb': self._get_memory_usage(),
-            'cpu_percent': psutil.cpu_percent(interval=0.1)
-        })
-        
-        logger.info(f"{operation} completed in {duration:.2f}s")
+        duration = time.perf_counter() - start_time
+        self.record_duration(operation, duration)
         return duration
     
+    def record_duration(self, operation: str, duration: float) -> None:
+        """Record a duration the caller timed itself, bypassing active_timers"""
+        self.metrics[operation].append(
+            time.time(),
+            duration,
+            self._get_memory_usage(),
+            self._proc.cpu_percent(None)
+        )
+        
+        logger.info("%s completed in %.2fs", operation, duration)
+    
     def record_api_call(self, api_name: str, success: bool = True) -> None:
         """Record an API call"""
         self.api_call_counts[api_name] += 1
         if not success:
             self.error_counts[api_name] += 1
     
+    def _cached(self, key: str, ttl: float, fn: Callable[[], Any]) -> Any:
+        """Return fn() reusing the previous result for ttl seconds"""
+        now = time.monotonic()
+        entry = self._cache.get(key)
+        if entry is not None and entry[1] > now:
+            return entry[0]
+        value = fn()
+        self._cache[key] = (value, now + ttl)
+        return value
+    
     def _get_memory_usage(self) -> float:
         """Get current memory usage in MB"""
-        process = psutil.Process()
-        return process.memory_info().rss / (1024 * 1024)
+        return self._proc.memory_info().rss / (1024 * 1024)
     
     def get_performance_summary(self) -> Dict[str, Any]:
         """Get a summary of performance metrics"""
+        # Non-blocking: system CPU since the previous call (primed in __init__)
+        virtual_memory = self._cached('virtual_memory', 1.0, psutil.virtual_memory)
         summary = {
             'timestamp': datetime.now().isoformat(),
             'system_metrics': {
-                'cpu_percent': psutil.cpu_percent(interval=1),
-                'memory_percent': psutil.virtual_memory().percent,
-                'memory_available_gb': psutil.virtual_memory().available / (1024**3)
+                'cpu_percent': psutil.cpu_percent(None),
+                'memory_percent': virtual_memory.percent,
+                'memory_available_gb': virtual_memory.available / (1024**3)
             },
             'operation_metrics': {},
             'api_metrics': {
@@ -135,16 +262,15 @@ class PerformanceMonitor:
         }
         
         # Calculate operation statistics
-        for operation, metrics in self.metrics.items():
-            if metrics:
-                durations = [m['duration'] for m in metrics]
+        for operation, samples in self.metrics.items():
+            if samples.count:
                 summary['operation_metrics'][operation] = {
-                    'count': len(metrics),
-                    'total_time': sum(durations),
-                    'avg_time': sum(durations) / len(durations),
-                    'min_time': min(durations),
-                    'max_time': max(durations),
-                    'last_run': metrics[-1]['timestamp']
+                    'count': samples.count,
+                    'total_time': samples.total_time,
+                    'avg_time': samples.total_time / samples.count,
+                    'min_time': samples.min_time,
+                    'max_time': samples.max_time,
+                    'last_run': datetime.fromtimestamp(samples.last_timestamp).isoformat()
                 }
         
         return summary
@@ -163,15 +289,19 @@ class PerformanceMonitor:
         """Save metrics to file"""
         summary = self.get_performance_summary()
         
-        # Add historical data
-        summary['history'] = {
-            'operations': dict(self.metrics),
-            'api_calls': dict(self.api_call_counts),
-            'errors': dict(self.error_counts)
-        }
-        
-        with open(filepath, 'w') as f:
-            json.dump(summary, f, indent=2)
+        with open(filepath, 'w', encoding='utf-8') as f:
+            # Write the summary, then append historical data one sample at a
+            # time so the full history is never copied into a single dict
+            f.write(_dumps_json(summary, indent=True).rstrip()[:-1].rstrip())
+            f.write(',\n  "history": {\n    "operations": {')
+            for i, (operation, samples) in enumerate(self.metrics.items()):
+                f.write(f'{"," if i else ""}\n      {_dumps_json(operation)}: [')
+                for j, record in enumerate(samples.iter_records()):
+                    f.write(f'{"," if j else ""}\n        {_dumps_json(record)}')
+                f.write('\n      ]' if samples else ']')
+            f.write('\n    },\n')
+            f.write(f'    "api_calls": {_dumps_json(dict(self.api_call_counts))},\n')
+            f.write(f'    "errors": {_dumps_json(dict(self.error_counts))}\n  }}\n}}\n')
         
         logger.info(f"Performance metrics saved to {filepath}")
     
@@ -205,10 +335,12 @@ class PerformanceMonitor:
     
     async def _monitor_system(self, interval: float):
         """Continuous system monitoring loop"""
+        loop = asyncio.get_event_loop()
+        next_deadline = loop.time()
         while self._monitoring_active:
             try:
                 metrics = self._capture_system_metrics()
-                self.system_metrics.append(metrics)
+                self._record_system_metrics(metrics)
                 
                 # Update peaks
                 self.peak_memory_mb = max(self.peak_memory_mb, metrics.memory_mb)
@@ -217,23 +349,36 @@ class PerformanceMonitor:
                 if self.debug and len(self.system_metrics) % 12 == 0:  # Log every minute at 5s intervals
                     logger.debug(f"💻 System: CPU {metrics.cpu_percent:.1f}%, Memory {metrics.memory_mb:.0f}MB ({metrics.memory_percent:.1f}%)")
                 
-                await asyncio.sleep(interval)
-                
             except Exception as e:
                 logger.warning(f"System monitoring error: {e}")
-                await asyncio.sleep(interval)
+            
+            # Sleep to an absolute deadline so capture time does not stretch
+            # the period; after a stall, resume from now instead of bursting
+            next_deadline = max(next_deadline + interval, loop.time())
+            await asyncio.sleep(next_deadline - loop.time())
+    
+    def _record_system_metrics(self, metrics: SystemMetrics) -> None:
+        """Append a snapshot and keep the window's running sums current"""
+        if len(self.system_metrics) == self.system_metrics.maxlen:
+            evicted = self.system_metrics[0]
+            self._system_memory_total -= evicted.memory_mb
+            self._system_cpu_total -= evicted.cpu_percent
+        self.system_metrics.append(metrics)
+        self._system_memory_total += metrics.memory_mb
+        self._system_cpu_total += metrics.cpu_percent
     
     def _capture_system_metrics(self) -> SystemMetrics:
         """Capture current system metrics"""
-        process = psutil.Process()
-        memory_info = process.memory_info()
+        process = self._sampler_proc
+        # as_dict reads the process stats inside a single oneshot() pass
+        info = process.as_dict(attrs=['cpu_percent', 'memory_percent', 'memory_info'])
         
         return SystemMetrics(
             timestamp=time.time(),
-            cpu_percent=process.cpu_percent(),
-            memory_percent=process.memory_percent(),
-            memory_mb=memory_info.rss / 1024 / 1024,
-            disk_usage_percent=psutil.disk_usage('/').percent,
+            cpu_percent=info['cpu_percent'],
+            memory_percent=info['memory_percent'],
+            memory_mb=info['memory_info'].rss / 1024 / 1024,
+            disk_usage_percent=self._cached('disk_usage', 60.0, lambda: psutil.disk_usage('/')).percent,
             active_connections=len(process.connections())
         )
     
@@ -244,6 +389,7 @@ class PerformanceMonitor:
             start_time=time.time()
         )
         self.operation_metrics.append(metrics)
+        self._operations_started += 1
         
         if self.debug:
             logger.debug(f"⏱️ Started: {operation_name}")
@@ -255,6 +401,27 @@ class PerformanceMonitor:
         """Complete an operation and update enhanced metrics"""
         metrics.complete(success=success, error_message=error_message, data_size=data_size, api_calls=api_calls)
         
+        if success:
+            self._operations_succeeded += 1
+            stats = self._op_stats.get(metrics.operation_name)
+            if stats is None:
+                stats = self._op_stats[metrics.operation_name] = {
+                    'count': 0,
+                    'total_duration': 0,
+                    'min_duration': float('inf'),
+                    'max_duration': 0,
+                    'total_data': 0,
+                    'total_api_calls': 0
+                }
+            stats['count'] += 1
+            stats['total_duration'] += metrics.duration
+            stats['min_duration'] = min(stats['min_duration'], metrics.duration)
+            stats['max_duration'] = max(stats['max_duration'], metrics.duration)
+            stats['total_data'] += data_size
+            stats['total_api_calls'] += api_calls
+        else:
+            self._operations_failed += 1
+        
         # Update counters
         if api_calls > 0:
             self.total_api_calls += api_calls
@@ -275,59 +442,33 @@ class PerformanceMonitor:
         current_time = time.time()
         total_runtime = current_time - self.start_time
         
-        # Enhanced operation statistics
-        successful_ops = [op for op in self.operation_metrics if op.success and op.duration is not None]
-        failed_ops = [op for op in self.operation_metrics if not op.success]
-        
-        operation_stats = {}
-        for op in successful_ops:
-            if op.operation_name not in operation_stats:
-                operation_stats[op.operation_name] = {
-                    'count': 0,
-                    'total_duration': 0,
-                    'min_duration': float('inf'),
-                    'max_duration': 0,
-                    'total_data': 0,
-                    'total_api_calls': 0
-                }
-            
-            stats = operation_stats[op.operation_name]
-            stats['count'] += 1
-            stats['total_duration'] += op.duration
-            stats['min_duration'] = min(stats['min_duration'], op.duration)
-            stats['max_duration'] = max(stats['max_duration'], op.duration)
-            stats['total_data'] += op.data_size
-            stats['total_api_calls'] += op.api_calls
-        
-        # Calculate averages
-        for stats in operation_stats.values():
-            if stats['count'] > 0:
-                stats['avg_duration'] = stats['total_duration'] / stats['count']
-            if stats['min_duration'] == float('inf'):
-                stats['min_duration'] = 0
+        # Enhanced operation statistics, maintained by complete_operation
+        operation_stats = {
+            name: dict(stats, avg_duration=stats['total_duration'] / stats['count'])
+            for name, stats in self._op_stats.items()
+        }
         
         # System resource statistics
         system_stats = {}
         if self.system_metrics:
-            memory_values = [m.memory_mb for m in self.system_metrics]
-            cpu_values = [m.cpu_percent for m in self.system_metrics]
+            sample_count = len(self.system_metrics)
             
             system_stats = {
-                'avg_memory_mb': sum(memory_values) / len(memory_values),
+                'avg_memory_mb': self._system_memory_total / sample_count,
                 'peak_memory_mb': self.peak_memory_mb,
-                'avg_cpu_percent': sum(cpu_values) / len(cpu_values),
+                'avg_cpu_percent': self._system_cpu_total / sample_count,
                 'peak_cpu_percent': self.peak_cpu_percent,
-                'monitoring_duration': len(self.system_metrics) * 5.0  # Assuming 5s intervals
+                'monitoring_duration': self.system_metrics[-1].timestamp - self.system_metrics[0].timestamp
             }
         
         return {
             'summary': {
                 'monitor_name': self.name,
                 'total_runtime': total_runtime,
-                'total_operations': len(self.operation_metrics),
-                'successful_operations': len(successful_ops),
-                'failed_operations': len(failed_ops),
-                'success_rate': len(successful_ops) / len(self.operation_metrics) if self.operation_metrics else 0,
+                'total_operations': self._operations_started,
+                'successful_operations': self._operations_succeeded,
+                'failed_operations': self._operations_failed,
+                'success_rate': self._operations_succeeded / self._operations_started if self._operations_started else 0,
                 'total_api_calls': self.total_api_calls,
                 'total_data_processed': self.total_data_processed
             },
@@ -341,73 +482,90 @@ class PerformanceMonitor:
     def print_performance_report(self):
         """Print human-readable performance report"""
         summary = self.get_enhanced_performance_summary()
+        lines = []
         
-        print(f"\n{'='*60}")
-        print(f"📊 PERFORMANCE REPORT: {self.name}")
-        print(f"{'='*60}")
+        lines.append(f"\n{'='*60}")
+        lines.append(f"📊 PERFORMANCE REPORT: {self.name}")
+        lines.append(f"{'='*60}")
         
         # Overall summary
         overall = summary['summary']
-        print(f"⏱️  Total Runtime: {overall['total_runtime']:.1f}s")
-        print(f"✅ Success Rate: {overall['success_rate']*100:.1f}% ({overall['successful_operations']}/{overall['total_operations']})")
-        print(f"🔗 Total API Calls: {overall['total_api_calls']}")
-        print(f"📊 Data Processed: {overall['total_data_processed']} items")
+        lines.append(f"⏱️  Total Runtime: {overall['total_runtime']:.1f}s")
+        lines.append(f"✅ Success Rate: {overall['success_rate']*100:.1f}% ({overall['successful_operations']}/{overall['total_operations']})")
+        lines.append(f"🔗 Total API Calls: {overall['total_api_calls']}")
+        lines.append(f"📊 Data Processed: {overall['total_data_processed']} items")
         
         # Operation breakdown
         if summary['operation_stats']:
-            print(f"\n📋 OPERATION BREAKDOWN:")
+            lines.append(f"\n📋 OPERATION BREAKDOWN:")
             for op_name, stats in summary['operation_stats'].items():
-                print(f"  {op_name}:")
-                print(f"    Count: {stats['count']}")
-                print(f"    Avg Duration: {stats['avg_duration']:.2f}s")
-                print(f"    Range: {stats['min_duration']:.2f}s - {stats['max_duration']:.2f}s")
+                lines.append(f"  {op_name}:")
+                lines.append(f"    Count: {stats['count']}")
+                lines.append(f"    Avg Duration: {stats['avg_duration']:.2f}s")
+                lines.append(f"    Range: {stats['min_duration']:.2f}s - {stats['max_duration']:.2f}s")
                 if stats['total_data'] > 0:
-                    print(f"    Data: {stats['total_data']} items")
+                    lines.append(f"    Data: {stats['total_data']} items")
                 if stats['total_api_calls'] > 0:
-                    print(f"    API Calls: {stats['total_api_calls']}")
+                    lines.append(f"    API Calls: {stats['total_api_calls']}")
         
         # System resources
         if summary['system_stats']:
             sys_stats = summary['system_stats']
-            print(f"\n💻 SYSTEM RESOURCES:")
-            print(f"  Memory: {sys_stats['avg_memory_mb']:.0f}MB avg, {sys_stats['peak_memory_mb']:.0f}MB peak")
-            print(f"  CPU: {sys_stats['avg_cpu_percent']:.1f}% avg, {sys_stats['peak_cpu_percent']:.1f}% peak")
+            lines.append(f"\n💻 SYSTEM RESOURCES:")
+            lines.append(f"  Memory: {sys_stats['avg_memory_mb']:.0f}MB avg, {sys_stats['peak_memory_mb']:.0f}MB peak")
+            lines.append(f"  CPU: {sys_stats['avg_cpu_percent']:.1f}% avg, {sys_stats['peak_cpu_percent']:.1f}% peak")
         
         # Errors
         if summary['error_counts']:
-            print(f"\n❌ ERROR SUMMARY:")
+            lines.append(f"\n❌ ERROR SUMMARY:")
             for error_type, count in summary['error_counts'].items():
-                print(f"  {error_type}: {count}")
+                lines.append(f"  {error_type}: {count}")
+        
+        lines.append(f"{'='*60}\n")
         
-        print(f"{'='*60}\n")
+        # One write for the whole report instead of one per line
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 def monitor_performance(operation_name: str = None):
     """Decorator to monitor function performance"""
     def decorator(func: Callable) -> Callable:
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            # Use function name if operation_name not provided
-            op_name = operation_name or f"{func.__module__}.{func.__name__}"
-            
-            # Get or create monitor instance
-            if not hasattr(wrapper, '_monitor'):
-                wrapper._monitor = PerformanceMonitor()
-            
-            monitor = wrapper._monitor
-            monitor.start_timer(op_name)
-            
-            try:
-                result = func(*args, **kwargs)
-                return result
-            except Exception as e:
-                monitor.record_api_call(op_name, success=False)
-                raise
-            finally:
-                monitor.end_timer(op_name)
+        # One monitor per decorated function, bound at decoration time
+        monitor = PerformanceMonitor()
+        # Use function name if operation_name not provided
+        op_name = operation_name or f"{func.__module__}.{func.__name__}"
+        
+        # Each call keeps its own start time: calls can overlap (awaits,
+        # threads), and the name-keyed active_timers holds one per operation
+        if asyncio.iscoroutinefunction(func):
+            # Time the awaited coroutine, not just its creation
+            @wraps(func)
+            async def wrapper(*args, **kwargs):
+                start = time.perf_counter()
+                
+                try:
+                    return await func(*args, **kwargs)
+                except Exception:
+                    monitor.record_api_call(op_name, success=False)
+                    raise
+                finally:
+                    monitor.record_duration(op_name, time.perf_counter() - start)
+        else:
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                start = time.perf_counter()
+                
+                try:
+                    result = func(*args, **kwargs)
+                    return result
+                except Exception as e:
+                    monitor.record_api_call(op_name, success=False)
+                    raise
+                finally:
+                    monitor.record_duration(op_name, time.perf_counter() - start)
         
         # Attach monitor to wrapper for external access
-        wrapper.get_monitor = lambda: getattr(wrapper, '_monitor', None)
+        wrapper.get_monitor = lambda: monitor
         return wrapper
     
     return decorator
@@ -416,9 +574,10 @@ def monitor_performance(operation_name: str = None):
 class PerformanceContext:
     """Context manager for performance monitoring"""
     
-    def __init__(self, operation: str, monitor: PerformanceMonitor = None):
+    def __init__(self, operation: str, monitor: Optional[PerformanceMonitor] = None):
         self.operation = operation
-        self.monitor = monitor or PerformanceMonitor()
+        # Default to the shared monitor so timings outlive the context
+        self.monitor = monitor or get_global_enhanced_monitor()
     
     def __enter__(self):
         self.monitor.start_timer(self.operation)
@@ -9,12 +9,39 @@ import re
 import logging
 import hashlib
 import time
+from collections import deque
 from typing import Dict, List, Any, Optional, Union
 from datetime import datetime, timedelta
 from functools import wraps
+from urllib.parse import urlsplit
 
 logger = logging.getLogger(__name__)
 
+# Default API key formats, compiled once at import and applied with fullmatch
+_DEFAULT_API_KEY_PATTERNS = {
+    'openai': re.compile(r'sk-[a-zA-Z0-9_-]{20,}'),
+    'reddit': re.compile(r'[a-zA-Z0-9_-]{10,25}'),
+    'google': re.compile(r'[a-zA-Z0-9_-]{30,50}'),
+    'twitter': re.compile(r'[a-zA-Z0-9]{100,}')
+}
+
+# Defaults used when config has no security section; shared, read-only
+_DEFAULT_RATE_LIMITS = {
+    'openai': {'max_calls': 60, 'time_window': 60},
+    'reddit': {'max_calls': 100, 'time_window': 60},
+    'google': {'max_calls': 100, 'time_window': 86400},
+    'twitter': {'max_calls': 300, 'time_window': 900}
+}
+
+_DEFAULT_INPUT_VALIDATION = {
+    'max_text_length': 10000,
+    'max_prompt_length': 50000,
+    'max_title_length': 500,
+    'max_query_length': 200,
+    'max_log_length': 100,
+    'suspicious_domains': ['bit.ly', 'tinyurl.com', 'short.link', 'suspicious.com']
+}
+
 class SecurityError(Exception):
     """Custom security exception"""
     pass
@@ -25,35 +52,39 @@ class RateLimiter:
     def __init__(self, max_calls: int, time_window: int):
         self.max_calls = max_calls
         self.time_window = time_window
-        self.calls = []
+        self.calls = deque()  # Call times, oldest first
+        # Monotonic clock so wall-clock adjustments cannot stretch or reset the window
+        self._now = time.monotonic
     
     def can_make_call(self) -> bool:
         """Check if a call can be made within rate limits"""
-        now = time.time()
+        calls = self.calls
+        # Pruning can only lower the count, so skip it until the window looks full
+        if len(calls) < self.max_calls:
+            return True
+        
+        cutoff = self._now() - self.time_window
         # Remove old calls outside the time window
-        self.calls = [call_time for call_time in self.calls if now - call_time < self.time_window]
+        while calls and calls[0] <= cutoff:
+            calls.popleft()
         
-        return len(self.calls) < self.max_calls
+        return len(calls) < self.max_calls
     
     def record_call(self):
         """Record a successful API call"""
-        self.calls.append(time.time())
+        self.calls.append(self._now())
 
 class SecureCredentialManager:
     """Manages secure handling of API credentials"""
     
+    # Hashes of (service, pattern, key) combinations that already passed the
+    # format check, so repeat validations of the same key skip the regex
+    _validated_keys = set()
+    _VALIDATED_KEYS_MAX = 64
+    
     def __init__(self, config=None):
         # Load rate limits from config or use defaults
-        if config and 'security' in config and 'rate_limits' in config['security']:
-            rate_config = config['security']['rate_limits']
-        else:
-            # Default rate limits if config not available
-            rate_config = {
-                'openai': {'max_calls': 60, 'time_window': 60},
-                'reddit': {'max_calls': 100, 'time_window': 60},
-                'google': {'max_calls': 100, 'time_window': 86400},
-                'twitter': {'max_calls': 300, 'time_window': 900}
-            }
+        rate_config = (config or {}).get('security', {}).get('rate_limits', _DEFAULT_RATE_LIMITS)
         
         self.rate_limiters = {}
         for service, limits in rate_config.items():
@@ -66,27 +97,27 @@ class SecureCredentialManager:
     def validate_api_key(service: str, api_key: Optional[str], config=None) -> bool:
         """Validate API key format and existence"""
         if not api_key:
-            logger.warning(f"🔒 {service} API key is missing")
+            logger.warning("🔒 %s API key is missing", service)
             return False
         
         # Load validation patterns from config or use defaults
-        if config and 'security' in config and 'api_key_patterns' in config['security']:
-            validation_patterns = config['security']['api_key_patterns']
-        else:
-            # Default validation patterns
-            validation_patterns = {
-                'openai': r'^sk-[a-zA-Z0-9_-]{20,}$',
-                'reddit': r'^[a-zA-Z0-9_-]{10,25}$', 
-                'google': r'^[a-zA-Z0-9_-]{30,50}$',
-                'twitter': r'^[a-zA-Z0-9]{100,}$'
-            }
+        validation_patterns = (config or {}).get('security', {}).get(
+            'api_key_patterns', _DEFAULT_API_KEY_PATTERNS)
         
         pattern = validation_patterns.get(service)
-        if pattern and not re.match(pattern, api_key):
-            logger.warning(f"🔒 {service} API key format appears invalid")
-            return False
-        
-        logger.info(f"✅ {service} API key validation passed")
+        if pattern:
+            validated_keys = SecureCredentialManager._validated_keys
+            key_hash = hash((service, pattern, api_key))
+            if key_hash not in validated_keys:
+                # Config patterns are strings; re.compile returns compiled ones as-is
+                if not re.compile(pattern).fullmatch(api_key):
+                    logger.warning("🔒 %s API key format appears invalid", service)
+                    return False
+                if len(validated_keys) >= SecureCredentialManager._VALIDATED_KEYS_MAX:
+                    validated_keys.clear()
+                validated_keys.add(key_hash)
+        
+        logger.info("✅ %s API key validation passed", service)
         return True
     
     @staticmethod
@@ -99,38 +130,66 @@ class SecureCredentialManager:
     
     def check_rate_limit(self, service: str) -> bool:
         """Check if service is within rate limits"""
-        if service not in self.rate_limiters:
-            logger.warning(f"🔒 No rate limiter configured for service: {service}")
+        limiter = self.rate_limiters.get(service)
+        if limiter is None:
+            logger.warning("🔒 No rate limiter configured for service: %s", service)
             return True
         
-        can_call = self.rate_limiters[service].can_make_call()
+        can_call = limiter.can_make_call()
         if not can_call:
-            logger.warning(f"🔒 Rate limit exceeded for {service}")
+            logger.warning("🔒 Rate limit exceeded for %s", service)
         
         return can_call
     
     def record_api_call(self, service: str):
         """Record an API call for rate limiting"""
-        if service in self.rate_limiters:
-            self.rate_limiters[service].record_call()
+        limiter = self.rate_limiters.get(service)
+        if limiter is not None:
+            limiter.record_call()
 
 class InputValidator:
     """Validates and sanitizes external inputs"""
     
+    # Characters stripped from URLs; str.translate drops them in one C-level pass
+    DANGEROUS_URL_CHARS_TABLE = str.maketrans('', '', '<>"\'')
+    # Patterns compiled once and shared by every validator instance; anchored
+    # ones are unanchored here and applied with fullmatch
+    # URLs are split with urlsplit and each part checked on its own; a
+    # single regex over the whole URL backtracks quadratically on long hosts
+    URL_HOST_PATTERN = re.compile(r'[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}(?::\d+)?')
+    URL_REMAINDER_PATTERN = re.compile(r'[\/\w\-\._~:/?#[\]@!\$&\'\(\)\*\+,;%=.]*')
+    SCRIPT_TAG_PATTERN = re.compile(r'<script[^>]*>.*?</script>', re.IGNORECASE | re.DOTALL)
+    # SQL injection checks fused into one alternation so text is scanned
+    # once; the shared leading word boundary is factored out of the branches
+    SQL_INJECTION_PATTERN = re.compile(r"""
+        \b(?:
+            union\s+select\b             # UNION SELECT attacks
+          | or\s+1\s*=\s*1\b             # OR 1=1 attacks
+          | select\s+\*\s+from\s+\w+     # SELECT * FROM table
+          | drop\s+table\s+\w+           # DROP TABLE attacks
+          | insert\s+into\s+\w+          # INSERT INTO attacks
+          | delete\s+from\s+\w+          # DELETE FROM attacks
+          | exec\s*\(                    # EXEC() attacks
+          | xp_cmdshell\b                # SQL Server command execution
+        )
+      | ;\s*drop\s                       # ; DROP attacks
+      | '\s*;\s*\w+\s*--                 # SQL comment attacks
+    """, re.IGNORECASE | re.VERBOSE)
+    # Every script tag or SQL injection match contains one of these literals;
+    # text without any of them (checked case-folded) skips both regexes
+    INJECTION_HINT_CHARS = ('<', ';', '=')
+    INJECTION_HINT_WORDS = ('select', 'drop', 'insert', 'delete', 'exec', 'xp_cmdshell')
+    SUBREDDIT_PATTERN = re.compile(r'[a-zA-Z0-9_]{1,21}')
+    EMAIL_PATTERN = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+    
     def __init__(self, config=None):
-        # Load input validation settings from config
-        if config and 'security' in config and 'input_validation' in config['security']:
-            self.settings = config['security']['input_validation']
-        else:
-            # Default settings
-            self.settings = {
-                'max_text_length': 10000,
-                'max_prompt_length': 50000,
-                'max_title_length': 500,
-                'max_query_length': 200,
-                'max_log_length': 100,
-                'suspicious_domains': ['bit.ly', 'tinyurl.com', 'short.link', 'suspicious.com']
-            }
+        # Load input validation settings from config or use defaults
+        self.settings = (config or {}).get('security', {}).get(
+            'input_validation', _DEFAULT_INPUT_VALIDATION)
+        
+        self.suspicious_domains = frozenset(
+            domain.lower() for domain in self.settings.get('suspicious_domains', [])
+        )
     
     def sanitize_url(self, url: str) -> Optional[str]:
         """Sanitize and validate URLs"""
@@ -138,21 +197,32 @@ class InputValidator:
             return None
         
         # Remove potentially dangerous characters
-        url = re.sub(r'[<>"\']', '', url)
+        url = url.translate(self.DANGEROUS_URL_CHARS_TABLE)
         
         # Validate URL format
-        url_pattern = r'^https?:\/\/[a-zA-Z0-9\-\.]+\.[a-zA-Z]{2,}[\/\w\-\._~:/?#[\]@!\$&\'\(\)\*\+,;%=.]*$'
-        if not re.match(url_pattern, url):
-            logger.warning(f"🔒 Invalid URL format: {self.truncate_for_log(url)}")
+        try:
+            parts = urlsplit(url)
+        except ValueError:
+            parts = None
+        
+        prefix = f"{parts.scheme}://{parts.netloc}" if parts else ""
+        if (parts is None
+                or parts.scheme not in ('http', 'https')
+                or not url.startswith(prefix)
+                or not self.URL_HOST_PATTERN.fullmatch(parts.netloc)
+                or not self.URL_REMAINDER_PATTERN.fullmatch(url, len(prefix))):
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning("🔒 Invalid URL format: %s", self.truncate_for_log(url))
             return None
         
-        # Block suspicious domains
-        suspicious_domains = self.settings.get('suspicious_domains', [])
-        
-        for domain in suspicious_domains:
-            if domain in url.lower():
-                logger.warning(f"🔒 Blocked suspicious domain in URL: {domain}")
-                return None
+        # Block suspicious domains and their subdomains (hostname is lowercased)
+        if self.suspicious_domains:
+            host = parts.hostname or ''
+            while host:
+                if host in self.suspicious_domains:
+                    logger.warning("🔒 Blocked suspicious domain in URL: %s", host)
+                    return None
+                host = host.partition('.')[2]
         
         return url
     
@@ -168,41 +238,39 @@ class InputValidator:
         # Truncate if too long
         if len(text) > max_length:
             text = text[:max_length]
-            logger.warning(f"🔒 Text truncated to {max_length} characters")
+            logger.warning("🔒 Text truncated to %d characters", max_length)
+        
+        # Plain text needs no regex pass; non-ASCII text always takes the full
+        # path since IGNORECASE folds characters such as 'ſ' onto ASCII letters
+        if text.isascii() and not self._has_injection_hint(text):
+            return text.strip()
         
         # Remove potentially dangerous patterns
         # Remove script tags
-        text = re.sub(r'<script[^>]*>.*?</script>', '', text, flags=re.IGNORECASE | re.DOTALL)
+        text = self.SCRIPT_TAG_PATTERN.sub('', text)
         
         # Remove SQL injection patterns (more intelligent detection)
-        sql_patterns = [
-            r'(\bunion\s+select\b)',                    # UNION SELECT attacks
-            r'(\bor\s+1\s*=\s*1\b)',                   # OR 1=1 attacks  
-            r'(\bselect\s+\*\s+from\s+\w+)',          # SELECT * FROM table
-            r'(\bdrop\s+table\s+\w+)',                # DROP TABLE attacks
-            r'(\binsert\s+into\s+\w+)',               # INSERT INTO attacks
-            r'(\bdelete\s+from\s+\w+)',               # DELETE FROM attacks
-            r'(\bexec\s*\(\s*)',                      # EXEC() attacks
-            r'(\bxp_cmdshell\b)',                     # SQL Server command execution
-            r'(;\s*drop\s+)',                         # ; DROP attacks
-            r'(\'\s*;\s*\w+\s*--)',                   # SQL comment attacks
-        ]
-        
-        for pattern in sql_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                logger.warning("🔒 Potential SQL injection attempt detected and blocked")
-                return ""
+        if self.SQL_INJECTION_PATTERN.search(text):
+            logger.warning("🔒 Potential SQL injection attempt detected and blocked")
+            return ""
         
         return text.strip()
     
+    def _has_injection_hint(self, text: str) -> bool:
+        """Check for literals that any script tag or SQL injection match requires"""
+        if any(char in text for char in self.INJECTION_HINT_CHARS):
+            return True
+        
+        text_lower = text.lower()
+        return any(word in text_lower for word in self.INJECTION_HINT_WORDS)
+    
     def validate_subreddit_name(self, subreddit: str) -> bool:
         """Validate Reddit subreddit name"""
         if not subreddit:
             return False
         
         # Reddit subreddit name pattern: letters, numbers, underscores
-        pattern = r'^[a-zA-Z0-9_]{1,21}$'
-        return bool(re.match(pattern, subreddit))
+        return bool(self.SUBREDDIT_PATTERN.fullmatch(subreddit))
     
     @staticmethod
     def validate_email(email: str) -> bool:
@@ -210,8 +278,7 @@ class InputValidator:
         if not email:
             return False
         
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return bool(re.match(pattern, email))
+        return bool(InputValidator.EMAIL_PATTERN.fullmatch(email))
     
     def truncate_for_log(self, text: str, max_length: int = None) -> str:
         """Safely truncate text for logging"""
@@ -364,12 +431,10 @@ def secure_api_call(service: str):
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            # Get credential manager instance
-            if hasattr(wrapper, '_credential_manager'):
-                cred_manager = wrapper._credential_manager
-            else:
-                cred_manager = SecureCredentialManager()
-                wrapper._credential_manager = cred_manager
+            # Share the global manager's limiters so every decorated call for a
+            # service counts against the same window; looked up per call so the
+            # singleton is not created before the config has been loaded
+            cred_manager = get_security_manager().credential_manager
             
             # Check rate limits
             if not cred_manager.check_rate_limit(service):
@@ -385,7 +450,7 @@ def secure_api_call(service: str):
                 return result
                 
             except Exception as e:
-                logger.error(f"🔒 Secure API call failed for {service}: {str(e)}")
+                logger.error("🔒 Secure API call failed for %s: %s", service, e)
                 raise
         
         return wrapper